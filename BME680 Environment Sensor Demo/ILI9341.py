@@ -1,7 +1,9 @@
 from micropython import const
-from machine import Pin, SPI
-from utime import sleep_ms
+from machine import Pin, SPI, mem32
+from utime import sleep_ms, sleep_us
 import framebuf
+import rp2
+import sys
 
 
 ILI9341_DC_pin = const(7)
@@ -95,15 +97,105 @@ ILI9341_3GAMMA_EN = const(0xF2)
 ILI9341_INTERFACE = const(0xF6)
 ILI9341_PRC = const(0xF7)
 
+ILI9341_INIT_SEQ = (
+    (ILI9341_RESET, b"", 5),
+    (ILI9341_POWERA, b"\x39\x2C\x00\x34\x02", 0),
+    (ILI9341_POWERB, b"\x00\xC1\x30", 0),
+    (ILI9341_DTCA, b"\x85\x00\x78", 0),
+    (ILI9341_DTCB, b"\x00\x00", 0),
+    (ILI9341_POWER_SEQ, b"\x64\x03\x12\x81", 0),
+    (ILI9341_PRC, b"\x20", 0),
+    (ILI9341_POWER1, b"\x23", 0),
+    (ILI9341_POWER2, b"\x10", 0),
+    (ILI9341_VCOM1, b"\x3E\x28", 0),
+    (ILI9341_VCOM2, b"\x86", 0),
+    (ILI9341_MAC, b"\x48", 0),
+    (ILI9341_PIXEL_FORMAT, b"\x55", 0),
+    (ILI9341_FRC, b"\x00\x18", 0),
+    (ILI9341_DFC, b"\x08\x82\x27", 0),
+    (ILI9341_3GAMMA_EN, b"\x00", 0),
+    (ILI9341_COLUMN_ADDR, b"\x00\x00\x00\xEF", 0),
+    (ILI9341_PAGE_ADDR, b"\x00\x00\x01\x3F", 0),
+    (ILI9341_GAMMA, b"\x01", 0),
+    (ILI9341_PGAMMA, b"\x0F\x31\x2B\x0C\x0E\x08\x4E\xF1\x37\x07\x10\x03\x0E\x09\x00", 0),
+    (ILI9341_NGAMMA, b"\x00\x0E\x14\x03\x11\x07\x31\xC1\x48\x08\x0F\x0C\x31\x36\x0F", 0),
+    (ILI9341_SLEEP_OUT, b"", 5),
+    (ILI9341_DISPLAY_ON, b"", 0),
+)
+
 X_Max = const(240)
 Y_Max = const(320)
 
 pixels = const(X_Max * Y_Max)
 
 
+SPI_SSPDR = const(0x008)
+SPI_SSPSR = const(0x00C)
+SPI_SSPSR_BSY = const(0x10)
+
+if('RP2350' in sys.implementation._machine):
+    SPI_BASE = (0x40080000, 0x40088000)
+    SPI_TX_DREQ = (24, 26)
+else:
+    SPI_BASE = (0x4003C000, 0x40040000)
+    SPI_TX_DREQ = (16, 18)
+
+
+class ILI9341_Band:
+
+    def __init__(self, fb, buffer):
+        self.fb = fb
+        self.buffer = buffer
+        self.y = 0
+
+
+    def fill(self, colour):
+        self.fb.fill(colour)
+
+
+    def pixel(self, x, y, *colour):
+        return self.fb.pixel(x, (y - self.y), *colour)
+
+
+    def hline(self, x, y, w, colour):
+        self.fb.hline(x, (y - self.y), w, colour)
+
+
+    def vline(self, x, y, h, colour):
+        self.fb.vline(x, (y - self.y), h, colour)
+
+
+    def line(self, x1, y1, x2, y2, colour):
+        self.fb.line(x1, (y1 - self.y), x2, (y2 - self.y), colour)
+
+
+    def rect(self, x, y, w, h, colour, *f):
+        self.fb.rect(x, (y - self.y), w, h, colour, *f)
+
+
+    def fill_rect(self, x, y, w, h, colour):
+        self.fb.fill_rect(x, (y - self.y), w, h, colour)
+
+
+    def ellipse(self, x, y, xr, yr, colour, *f):
+        self.fb.ellipse(x, (y - self.y), xr, yr, colour, *f)
+
+
+    def poly(self, x, y, coords, colour, *f):
+        self.fb.poly(x, (y - self.y), coords, colour, *f)
+
+
+    def text(self, s, x, y, colour = 1):
+        self.fb.text(s, x, (y - self.y), colour)
+
+
+    def blit(self, fbuf, x, y, *args):
+        self.fb.blit(fbuf, x, (y - self.y), *args)
+
+
 class TFT_ILI9341(framebuf.FrameBuffer):
 
-    def __init__(self, ):
+    def __init__(self, bands = 1):
         self.MAX_X = Y_Max
         self.MAX_Y = X_Max
 
@@ -130,180 +222,107 @@ class TFT_ILI9341(framebuf.FrameBuffer):
         self.ILI9341_SPI = SPI(0, 60_000_000, polarity = False, phase = False, sck = self.ILI9341_SCK, mosi = self.ILI9341_MOSI, miso = None)
         
         self.ILI9341_DC = Pin(ILI9341_DC_pin, Pin.OUT)
+        self.command_buffer = bytearray(1)
+        self.window_buffer = bytearray(4)
+        self.dma = rp2.DMA()
+        self.dma_ctrl = self.dma.pack_ctrl(size = 0, inc_write = False, treq_sel = SPI_TX_DREQ[0], irq_quiet = False)
+        self.dma.irq(handler = self.dma_done, hard = False)
+        self.dma_active = False
+        self.dma_callback = None
         self.ILI9341_BL.on()
 
-        self.buffer = bytearray(self.MAX_X * self.MAX_Y * 2)
-        super().__init__(self.buffer, self.MAX_X, self.MAX_Y, framebuf.RGB565)
+        self.bands = bands
+        self.band_height = ((self.MAX_Y + bands - 1) // bands)
+
+        self.buffer = bytearray(self.MAX_X * self.band_height * 2)
+        super().__init__(self.buffer, self.MAX_X, self.band_height, framebuf.RGB565)
+        self.buffer_view = memoryview(self.buffer)
+        self.band = ILI9341_Band(self, self.buffer)
+
+        if(bands > 1):
+            back_buffer = bytearray(len(self.buffer))
+            self.band_buffers = (self.buffer, back_buffer)
+            self.band_views = (self.buffer_view, memoryview(back_buffer))
+            self.band_fbs = (self, framebuf.FrameBuffer(back_buffer, self.MAX_X, self.band_height, framebuf.RGB565))
+        else:
+            self.band_buffers = (self.buffer, )
+            self.band_views = (self.buffer_view, )
+            self.band_fbs = (self, )
+
+        self.band_index = 0
 
         self.TFT_init()
 
 
     def write(self, value, mode):
-    	self.ILI9341_DC.value(mode)
+        self.ILI9341_DC.value(mode)
         self.ILI9341_CS.value(LOW)
-        self.ILI9341_SPI.write(bytearray([value]))
+        self.command_buffer[0] = value
+        self.ILI9341_SPI.write(self.command_buffer)
         self.ILI9341_CS.value(HIGH)
         
         
+    def cmd(self, command, data = b""):
+        self.ILI9341_CS.value(LOW)
+        self.ILI9341_DC.value(CMD)
+        self.command_buffer[0] = command
+        self.ILI9341_SPI.write(self.command_buffer)
+
+        if(len(data) > 0):
+            self.ILI9341_DC.value(DAT)
+            self.ILI9341_SPI.write(data)
+
+        self.ILI9341_CS.value(HIGH)
+
+
+    def write_sequence(self, sequence):
+        for command, parameters, delay in sequence:
+            self.cmd(command, parameters)
+
+            if(delay > 0):
+                sleep_ms(delay)
+
+
     def write_word(self, value, mode):
         lb = (value & 0x00FF)
         hb = ((value & 0xFF00) >> 0x08)
-    	self.write(hb, mode)
-    	self.write(lb, mode)
+        self.write(hb, mode)
+        self.write(lb, mode)
 
 
     def reset(self):
-    	self.ILI9341_RST.value(LOW)
-    	sleep_ms(20)
+        self.ILI9341_RST.value(LOW)
+        sleep_us(10)
         self.ILI9341_RST.value(HIGH)
+        sleep_ms(120)
 
 
     def TFT_init(self):
-    	self.reset()
-    	self.write(ILI9341_RESET, CMD)
-        sleep_ms(60)
-
-        self.write(ILI9341_POWERA, CMD)
-        self.write(0x39, DAT)
-        self.write(0x2C, DAT)
-        self.write(0x00, DAT)
-        self.write(0x34, DAT)
-        self.write(0x02, DAT)
-        
-        self.write(ILI9341_POWERB, CMD)
-        self.write(0x00, DAT)
-        self.write(0xC1, DAT)
-        self.write(0x30, DAT)
-
-        self.write(ILI9341_DTCA, CMD)
-        self.write(0x85, DAT)
-        self.write(0x00, DAT)
-        self.write(0x78, DAT)
-
-        self.write(ILI9341_DTCB, CMD)
-        self.write(0x00, DAT)
-        self.write(0x00, DAT)
-
-        self.write(ILI9341_POWER_SEQ, CMD)
-        self.write(0x64, DAT)
-        self.write(0x03, DAT)
-        self.write(0x12, DAT)
-        self.write(0x81, DAT)
-
-        self.write(ILI9341_PRC, CMD)
-        self.write(0x20, DAT)
-
-        self.write(ILI9341_POWER1, CMD)
-        self.write(0x23, DAT)
-
-        self.write(ILI9341_POWER2, CMD)
-        self.write(0x10, DAT)
-
-        self.write(ILI9341_VCOM1, CMD)
-        self.write(0x3E, DAT)
-        self.write(0x28, DAT)
-
-        self.write(ILI9341_VCOM2, CMD)
-        self.write(0x86, DAT)
-
-        self.write(ILI9341_MAC, CMD)
-        self.write(0x48, DAT)
-
-        self.write(ILI9341_PIXEL_FORMAT, CMD)
-        self.write(0x55, DAT)
-
-        self.write(ILI9341_FRC, CMD)
-        self.write(0x00, DAT)
-        self.write(0x18, DAT)
-
-        self.write(ILI9341_DFC, CMD)
-        self.write(0x08, DAT)
-        self.write(0x82, DAT)
-        self.write(0x27, DAT)
-
-        self.write(ILI9341_3GAMMA_EN, CMD)
-        self.write(0x00, DAT)
-
-        self.write(ILI9341_COLUMN_ADDR, CMD)
-        self.write(0x00, DAT)
-        self.write(0x00, DAT)
-        self.write(0x00, DAT)
-        self.write(0xEF, DAT)
-
-        self.write(ILI9341_PAGE_ADDR, CMD)
-        self.write(0x00, DAT)
-        self.write(0x00, DAT)
-        self.write(0x01, DAT)
-        self.write(0x3F, DAT)
-
-        self.write(ILI9341_GAMMA, CMD)
-        self.write(0x01, DAT)
-
-        self.write(ILI9341_PGAMMA, CMD)
-        self.write(0x0F, DAT)
-        self.write(0x31, DAT)
-        self.write(0x2B, DAT)
-        self.write(0x0C, DAT)
-        self.write(0x0E, DAT)
-        self.write(0x08, DAT)
-        self.write(0x4E, DAT)
-        self.write(0xF1, DAT)
-        self.write(0x37, DAT)
-        self.write(0x07, DAT)
-        self.write(0x10, DAT)
-        self.write(0x03, DAT)
-        self.write(0x0E, DAT)
-        self.write(0x09, DAT)
-        self.write(0x00, DAT)
-
-        self.write(ILI9341_NGAMMA, CMD)
-        self.write(0x00, DAT)
-        self.write(0x0E, DAT)
-        self.write(0x14, DAT)
-        self.write(0x03, DAT)
-        self.write(0x11, DAT)
-        self.write(0x07, DAT)
-        self.write(0x31, DAT)
-        self.write(0xC1, DAT)
-        self.write(0x48, DAT)
-        self.write(0x08, DAT)
-        self.write(0x0F, DAT)
-        self.write(0x0C, DAT)
-        self.write(0x31, DAT)
-        self.write(0x36, DAT)
-        self.write(0x0F, DAT)
-
-        self.write(ILI9341_SLEEP_OUT, CMD)
-        sleep_ms(100)
-        
-        self.display_on_off(True)
-        self.write(ILI9341_GRAM, CMD)
-
+        self.reset()
+        self.write_sequence(ILI9341_INIT_SEQ)
         self.set_rotation(self.LANDSCAPE_2)
 
 
     def display_on_off(self, status):
         if(status == True):
-            self.write(ILI9341_DISPLAY_ON, CMD)
+            self.cmd(ILI9341_DISPLAY_ON)
 
         else:
-            self.write(ILI9341_DISPLAY_OFF, CMD)
+            self.cmd(ILI9341_DISPLAY_OFF)
 
 
     def set_rotation(self, rotation):
-        self.write(ILI9341_MAC, CMD);
-        
         if(rotation == self.PORTRAIT_1):
-            self.write(0x58, DAT)
+            self.cmd(ILI9341_MAC, b"\x58")
 
         elif(rotation == self.PORTRAIT_2):
-            self.write(0x88, DAT)
+            self.cmd(ILI9341_MAC, b"\x88")
 
         elif(rotation == self.LANDSCAPE_1):
-            self.write(0x28, DAT)
+            self.cmd(ILI9341_MAC, b"\x28")
 
         else:
-            self.write(0xE8, DAT)
+            self.cmd(ILI9341_MAC, b"\xE8")
 
         if((rotation == self.PORTRAIT_1) or (rotation == self.PORTRAIT_2)):
             self.MAX_X = X_Max
@@ -315,18 +334,29 @@ class TFT_ILI9341(framebuf.FrameBuffer):
 
 
     def set_display_window(self, x_1, y_1, x_2, y_2):
-        self.write(ILI9341_COLUMN_ADDR, CMD)
-        self.write_word(x_1, DAT)
-        self.write_word((x_2 - 1), DAT)
+        self.window_buffer[0] = (x_1 >> 8)
+        self.window_buffer[1] = (x_1 & 0xFF)
+        self.window_buffer[2] = ((x_2 - 1) >> 8)
+        self.window_buffer[3] = ((x_2 - 1) & 0xFF)
+        self.cmd(ILI9341_COLUMN_ADDR, self.window_buffer)
+
+        self.window_buffer[0] = (y_1 >> 8)
+        self.window_buffer[1] = (y_1 & 0xFF)
+        self.window_buffer[2] = ((y_2 - 1) >> 8)
+        self.window_buffer[3] = ((y_2 - 1) & 0xFF)
+        self.cmd(ILI9341_PAGE_ADDR, self.window_buffer)
 
-        self.write(ILI9341_PAGE_ADDR, CMD)
-        self.write_word(y_1, DAT)
-        self.write_word((y_2 - 1), DAT)
+        self.cmd(ILI9341_GRAM)
 
-        self.write(ILI9341_GRAM, CMD)
+
+    def full_frame_only(self):
+        if(self.bands > 1):
+            raise ValueError("Banded mode holds one strip only, draw through render()")
 
 
     def show(self):
+        self.full_frame_only()
+        self.wait()
         self.set_display_window(0, 0, self.MAX_X, self.MAX_Y)
         
         self.ILI9341_DC.value(DAT)
@@ -335,6 +365,69 @@ class TFT_ILI9341(framebuf.FrameBuffer):
         self.ILI9341_CS.value(HIGH)
 
 
+    def busy(self):
+        return self.dma_active
+
+
+    def wait(self):
+        while(self.dma_active):
+            pass
+
+
+    def dma_done(self, dma):
+        while(mem32[SPI_BASE[0] + SPI_SSPSR] & SPI_SSPSR_BSY):
+            pass
+
+        self.ILI9341_CS.value(HIGH)
+        self.dma_active = False
+
+        if(self.dma_callback != None):
+            self.dma_callback()
+
+
+    def start_dma(self, data, callback):
+        self.dma_callback = callback
+        self.dma_active = True
+
+        self.ILI9341_DC.value(DAT)
+        self.ILI9341_CS.value(LOW)
+        self.dma.config(read = data, write = (SPI_BASE[0] + SPI_SSPDR), count = len(data), ctrl = self.dma_ctrl, trigger = True)
+
+
+    def show_async(self, callback = None):
+        self.full_frame_only()
+        self.wait()
+        self.set_display_window(0, 0, self.MAX_X, self.MAX_Y)
+        self.start_dma(self.buffer, callback)
+
+
+    def render(self, draw, callback = None):
+        index = self.band_index
+
+        for y in range(0, self.MAX_Y, self.band_height):
+            h = min(self.band_height, (self.MAX_Y - y))
+
+            if(len(self.band_fbs) == 1):
+                self.wait()
+
+            self.band.fb = self.band_fbs[index]
+            self.band.buffer = self.band_buffers[index]
+            self.band.y = y
+            draw(self.band)
+
+            self.wait()
+            self.set_display_window(0, y, self.MAX_X, (y + h))
+
+            if((y + h) < self.MAX_Y):
+                self.start_dma(self.band_views[index][0:(self.MAX_X * h * 2)], None)
+            else:
+                self.start_dma(self.band_views[index][0:(self.MAX_X * h * 2)], callback)
+
+            index = ((index + 1) % len(self.band_fbs))
+
+        self.band_index = index
+
+
     def colour_generator(self, r, g, b):
         r = (r & 0xF8)
         g = ((g & 0xFC) >> 2)
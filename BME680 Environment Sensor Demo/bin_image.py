@@ -0,0 +1,57 @@
+from micropython import const
+from struct import unpack
+
+
+BIN_IMAGE_MAGIC = b"R565"
+BIN_IMAGE_HEADER_SIZE = const(8)
+
+
+class bin_image():
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        header = self.file.read(BIN_IMAGE_HEADER_SIZE)
+        
+        if(header[0:4] != BIN_IMAGE_MAGIC):
+            raise ValueError("Invalid RGB565 image file!")
+        
+        self.width, self.height = unpack("<HH", header[4:8])
+        self.row_length = (self.width * 2)
+        
+        
+    def draw(self, buffer, width, height, x, y):
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min((x + self.width), width)
+        y1 = min((y + self.height), height)
+        
+        if((x0 >= x1) or (y0 >= y1)):
+            return
+        
+        view = memoryview(buffer)
+        
+        if((x0 == 0) and (x1 == width) and (self.width == width)):
+            self.file.seek(BIN_IMAGE_HEADER_SIZE + ((y0 - y) * self.row_length))
+            self.file.readinto(view[(y0 * width * 2):(y1 * width * 2)])
+            return
+        
+        length = ((x1 - x0) * 2)
+        skip = ((x0 - x) * 2)
+        
+        for row in range(y0, y1):
+            self.file.seek(BIN_IMAGE_HEADER_SIZE + ((row - y) * self.row_length) + skip)
+            start = (((row * width) + x0) * 2)
+            self.file.readinto(view[start:(start + length)])
+            
+            
+    def send(self, write, lines = 8):
+        chunk = memoryview(bytearray(self.row_length * lines))
+        self.file.seek(BIN_IMAGE_HEADER_SIZE)
+        
+        for row in range(0, self.height, lines):
+            length = (min(lines, (self.height - row)) * self.row_length)
+            self.file.readinto(chunk[0:length])
+            write(chunk[0:length])
+            
+            
+    def close(self):
+        self.file.close()
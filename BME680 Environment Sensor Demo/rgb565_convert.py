@@ -0,0 +1,61 @@
+# Host-side converter: python rgb565_convert.py <image file or Python image module> <output.bin>
+#
+# Output layout: b"R565", width (u16 LE), height (u16 LE), then width x height
+# RGB565 pixels, high byte first, ready to be copied into a frame buffer or
+# streamed to the panel without any swapping on the device.
+
+import struct
+import sys
+
+
+def rgb565(r, g, b):
+    colour = (((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3))
+    return bytes([(colour >> 8), (colour & 0xFF)])
+
+
+def load_module(path):
+    values = {}
+    
+    with open(path) as f:
+        exec(f.read(), {"bytearray": bytes}, values)
+        
+    return values["image_width"], values["image_height"], bytes(values["image_data"])
+
+
+def load_image(path):
+    from PIL import Image
+    
+    image = Image.open(path).convert("RGB")
+    data = bytearray()
+    
+    for r, g, b in image.getdata():
+        data += rgb565(r, g, b)
+        
+    return image.width, image.height, bytes(data)
+
+
+def main():
+    if(len(sys.argv) != 3):
+        print("usage: rgb565_convert.py <input .py/.png/.jpg/.bmp> <output.bin>")
+        sys.exit(1)
+        
+    source, target = sys.argv[1], sys.argv[2]
+    
+    if(source.endswith(".py")):
+        width, height, data = load_module(source)
+    else:
+        width, height, data = load_image(source)
+        
+    if(len(data) != (width * height * 2)):
+        print("Pixel data does not match %u x %u" % (width, height))
+        sys.exit(1)
+        
+    with open(target, "wb") as f:
+        f.write(b"R565" + struct.pack("<HH", width, height))
+        f.write(data)
+        
+    print("%s: %u x %u, %u bytes" % (target, width, height, (len(data) + 8)))
+
+
+if __name__ == "__main__":
+    main()
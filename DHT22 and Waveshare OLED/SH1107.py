@@ -62,7 +62,13 @@ class OLED_13(framebuf.FrameBuffer):
         self.dc = Pin(DC_pin, Pin.OUT)
         self.dc(HIGH)
         
+        self.command_buffer = bytearray(1)
+        self.column_buffer = bytearray(1)
         self.buffer = bytearray(self.height * (self.width // 8))
+        self.buffer_view = memoryview(self.buffer)
+        self.pages = [self.buffer_view[(page * 16):((page + 1) * 16)] for page in range(0, 64)]
+        self.dirty = bytearray(b"\xFF" * 8)
+        self.layer = None
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_HMSB)
         self.init_display()
         
@@ -70,7 +76,20 @@ class OLED_13(framebuf.FrameBuffer):
     def write(self, value, mode):
         self.dc(mode)
         self.cs(LOW)
-        self.spi.write(bytearray([value]))
+        self.command_buffer[0] = value
+        self.spi.write(self.command_buffer)
+        self.cs(HIGH)
+
+
+    def cmd(self, command, data = b""):
+        self.dc(CMD)
+        self.cs(LOW)
+        self.command_buffer[0] = command
+        self.spi.write(self.command_buffer)
+
+        if(len(data) > 0):
+            self.spi.write(data)
+
         self.cs(HIGH)
 
 
@@ -81,52 +100,132 @@ class OLED_13(framebuf.FrameBuffer):
         sleep_ms(10)
         self.rst(HIGH)
         
-        self.write(SH1107_DISPLAY_OFF, CMD)
-
-        self.write((SH1107_SET_LOWER_COLUMN_ADDRESS | 0x00), CMD)   
-        self.write((SH1107_SET_UPPER_COLUMN_ADDRESS | 0x00), CMD)   
-
-        self.write((SH1107_SET_PAGE_ADDRESS | 0x00), CMD)   
-      
-        self.write(SH1107_SET_DISPLAY_START_LINE, CMD)     
-        self.write(0x00, CMD) 
-        self.write(SH1107_SET_CONSTRAST_CONTROL, CMD)   
-        self.write(0x6F, CMD)    
-        self.write(SH1107_SET_VERTICAL_MEMORY_ADDRESSING_MODE, CMD) 
-    
-        self.write(SH1107_SET_SEGMENT_REMAP_NORMAL, CMD)   
-        self.write((SH1107_SET_COMMON_OUTPUT_SCAN_DIRECTION | 0x00), CMD)    
-        self.write(SH1107_SET_ENTIRE_DISPLAY_OFF, CMD)   
-
-        self.write(SH1107_SET_NORMAL_DISPLAY, CMD)   
-        self.write(SH1107_SET_MULTIPLEX_RATIO, CMD)   
-        self.write(0x3F, CMD)   
-  
-        self.write(SH1107_SET_DISPLAY_OFFSET, CMD)    
-        self.write(0x60, CMD)
-
-        self.write(SH1107_SET_DISPLAY_CLOCK_FREQUENCY, CMD)    
-        self.write(0x41, CMD)
-    
-        self.write(SH1107_SET_PRECHARGE_DISCHARGE_PERIOD, CMD)   
-        self.write(0x22, CMD)   
-
-        self.write(SH1107_SET_VCOM_DESELECT_LEVEL, CMD)   
-        self.write(0x35, CMD)  
-    
-        self.write(SH1107_SET_DC_DC_CONTROL_MODE, CMD)    
-        self.write(SH1107_SET_DC_DC_OFF_MODE, CMD)    
-        self.write(SH1107_DISPLAY_ON, CMD)
+        self.cmd(SH1107_DISPLAY_OFF)
+
+        self.cmd((SH1107_SET_LOWER_COLUMN_ADDRESS | 0x00), bytes([(SH1107_SET_UPPER_COLUMN_ADDRESS | 0x00), (SH1107_SET_PAGE_ADDRESS | 0x00)]))
+
+        self.cmd(SH1107_SET_DISPLAY_START_LINE, b"\x00")
+        self.cmd(SH1107_SET_CONSTRAST_CONTROL, b"\x6F")
+        self.cmd(SH1107_SET_VERTICAL_MEMORY_ADDRESSING_MODE)
+
+        self.cmd(SH1107_SET_SEGMENT_REMAP_NORMAL)
+        self.cmd((SH1107_SET_COMMON_OUTPUT_SCAN_DIRECTION | 0x00))
+        self.cmd(SH1107_SET_ENTIRE_DISPLAY_OFF)
+
+        self.cmd(SH1107_SET_NORMAL_DISPLAY)
+        self.cmd(SH1107_SET_MULTIPLEX_RATIO, b"\x3F")
+        self.cmd(SH1107_SET_DISPLAY_OFFSET, b"\x60")
+        self.cmd(SH1107_SET_DISPLAY_CLOCK_FREQUENCY, b"\x41")
+        self.cmd(SH1107_SET_PRECHARGE_DISCHARGE_PERIOD, b"\x22")
+        self.cmd(SH1107_SET_VCOM_DESELECT_LEVEL, b"\x35")
+        self.cmd(SH1107_SET_DC_DC_CONTROL_MODE, bytes([SH1107_SET_DC_DC_OFF_MODE]))
+        self.cmd(SH1107_DISPLAY_ON)
+
+
+    def mark_dirty(self, y, h):
+        y0 = max(y, 0)
+        y1 = min((y + h), self.height)
+
+        for page in range(y0, y1):
+            self.dirty[page >> 3] |= (1 << (page & 0x07))
+
+
+    def mark_all_dirty(self):
+        for i in range(0, 8):
+            self.dirty[i] = 0xFF
+
+
+    def fill(self, colour):
+        super().fill(colour)
+        self.mark_all_dirty()
+
+
+    def pixel(self, x, y, *colour):
+        if(len(colour) == 0):
+            return super().pixel(x, y)
+
+        super().pixel(x, y, colour[0])
+        if((y >= 0) and (y < self.height)):
+            self.dirty[y >> 3] |= (1 << (y & 0x07))
+
+
+    def hline(self, x, y, w, colour):
+        super().hline(x, y, w, colour)
+        self.mark_dirty(y, 1)
+
+
+    def vline(self, x, y, h, colour):
+        super().vline(x, y, h, colour)
+        self.mark_dirty(y, h)
+
+
+    def line(self, x1, y1, x2, y2, colour):
+        super().line(x1, y1, x2, y2, colour)
+        self.mark_dirty(min(y1, y2), (abs(y2 - y1) + 1))
+
+
+    def rect(self, x, y, w, h, colour, *f):
+        super().rect(x, y, w, h, colour, *f)
+        self.mark_dirty(y, h)
+
+
+    def fill_rect(self, x, y, w, h, colour):
+        super().fill_rect(x, y, w, h, colour)
+        self.mark_dirty(y, h)
+
+
+    def ellipse(self, x, y, xr, yr, colour, *f):
+        super().ellipse(x, y, xr, yr, colour, *f)
+        self.mark_dirty((y - yr), ((yr * 2) + 1))
+
+
+    def poly(self, x, y, coords, colour, *f):
+        super().poly(x, y, coords, colour, *f)
+        self.mark_all_dirty()
+
+
+    def text(self, s, x, y, colour = 1):
+        super().text(s, x, y, colour)
+        self.mark_dirty(y, 8)
+
+
+    def blit(self, fbuf, x, y, *args):
+        super().blit(fbuf, x, y, *args)
+        self.mark_all_dirty()
+
+
+    def scroll(self, xstep, ystep):
+        super().scroll(xstep, ystep)
+        self.mark_all_dirty()
 
 
     def show(self):
-        self.write(SH1107_SET_PAGE_ADDRESS, CMD)
+        self.cmd(SH1107_SET_PAGE_ADDRESS)
         for page in range(0, 64):
+            if((self.dirty[page >> 3] & (1 << (page & 0x07))) == 0):
+                continue
+
             self.column = (63 - page)
             
-            self.write((SH1107_SET_LOWER_COLUMN_ADDRESS + (self.column & 0x0F)), CMD)
-            self.write((SH1107_SET_UPPER_COLUMN_ADDRESS + (self.column >> 4)), CMD)
+            self.column_buffer[0] = (SH1107_SET_UPPER_COLUMN_ADDRESS + (self.column >> 4))
+            self.cmd((SH1107_SET_LOWER_COLUMN_ADDRESS + (self.column & 0x0F)), self.column_buffer)
             
-            for num in range(0, 16):
-                self.write((self.buffer[(page * 16) + num]), DAT)
+            self.dc(DAT)
+            self.cs(LOW)
+            self.spi.write(self.pages[page])
+            self.cs(HIGH)
+
+        for i in range(0, 8):
+            self.dirty[i] = 0x00
+
+
+    def save_layer(self):
+        if(self.layer == None):
+            self.layer = bytearray(len(self.buffer))
+
+        self.layer[:] = self.buffer
+
 
+    def restore_layer(self):
+        self.buffer[:] = self.layer
+        self.mark_all_dirty()
@@ -85,18 +85,23 @@ def draw_background():
         
         lcd.text(str("%s" % (100 - int(1.5 * i))), 52, (36 + i), lcd.CYAN)
         
+    lcd.save_layer()
+        
 
 def temp_bar(x_pos, y_pos, bar):
     for i in range (0, 3):
         lcd.line((x_pos + i), y_pos, (x_pos + i), bar, lcd.RED)
     
            
+lcd.fill(lcd.BLACK)
+draw_background()
+
+           
 while True:
     i = 0
     LED.toggle()
     tmp = array.array('f', [0, 0])
-    lcd.fill(lcd.BLACK)
-    draw_background()
+    lcd.restore_layer()
     
     ds.convert_temp()
     sleep_ms(750)
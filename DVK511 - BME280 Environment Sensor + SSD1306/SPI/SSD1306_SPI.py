@@ -66,15 +66,26 @@ class OLED1306(framebuf.FrameBuffer):
         self.rst = Pin(_rst, Pin.OUT)
         self.dc = Pin(_dc, Pin.OUT)    
         
+        self.command_buffer = bytearray(1)
+        self.window_buffer = bytearray(2)
         self.buffer = bytearray(self._pages * self.width)
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
 
     def write_command(self, value):
+        self.cmd(value)
+
+
+    def cmd(self, command, data = b""):
         self.dc.value(CMD)
         self.cs.value(LOW)
-        self.spi.write(bytearray([value]))
+        self.command_buffer[0] = command
+        self.spi.write(self.command_buffer)
+
+        if(len(data) > 0):
+            self.spi.write(data)
+
         self.cs.value(HIGH)
 
 
@@ -89,41 +100,22 @@ class OLED1306(framebuf.FrameBuffer):
     def init_display(self):
         self.reset()
 
-        self.write_command(SSD1306_DISPLAY_OFF)
-        self.write_command(SSD1306_SET_DISPLAY_CLOCK_DIV)
-        self.write_command(0x80)
-
-        self.write_command(SSD1306_SET_MULTIPLEX)
-        self.write_command((self.height - 1))
-
-        self.write_command(SSD1306_SET_DISPLAY_OFFSET)
-        self.write_command(0x00)
-
-        self.write_command((SSD1306_SET_START_LINE | 0x00))
-   
-        self.write_command(SSD1306_CHARGE_PUMP)
-        self.write_command(0x14)  # 0x10  # 0x14
-
-        self.write_command(SSD1306_MEMORY_MODE)
-        self.write_command(0x00)
-
-        self.write_command((SSD1306_SEG_REMAP | 0x01))
-        self.write_command(SSD1306_COM_SCAN_DEC)
-        self.write_command(SSD1306_SET_COM_PINS)
-        self.write_command(0x12)
-
-        self.write_command(SSD1306_SET_CONTRAST)
-        self.write_command(0xCF) # 0x9F # 0xCF
-
-        self.write_command(SSD1306_SET_PRECHARGE)
-        self.write_command(0xF1) # 0x22 # 0xF1
-
-        self.write_command(SSD1306_SET_VCOM_DETECT)
-        self.write_command(0x40)
-
-        self.write_command(SSD1306_DISPLAY_ALL_ON_RESUME)
-        self.write_command(SSD1306_NORMAL_DISPLAY)
-        self.write_command(SSD1306_DISPLAY_ON)
+        self.cmd(SSD1306_DISPLAY_OFF)
+        self.cmd(SSD1306_SET_DISPLAY_CLOCK_DIV, b"\x80")
+        self.cmd(SSD1306_SET_MULTIPLEX, bytes([(self.height - 1)]))
+        self.cmd(SSD1306_SET_DISPLAY_OFFSET, b"\x00")
+        self.cmd((SSD1306_SET_START_LINE | 0x00))
+        self.cmd(SSD1306_CHARGE_PUMP, b"\x14")  # 0x10  # 0x14
+        self.cmd(SSD1306_MEMORY_MODE, b"\x00")
+        self.cmd((SSD1306_SEG_REMAP | 0x01))
+        self.cmd(SSD1306_COM_SCAN_DEC)
+        self.cmd(SSD1306_SET_COM_PINS, b"\x12")
+        self.cmd(SSD1306_SET_CONTRAST, b"\xCF") # 0x9F # 0xCF
+        self.cmd(SSD1306_SET_PRECHARGE, b"\xF1") # 0x22 # 0xF1
+        self.cmd(SSD1306_SET_VCOM_DETECT, b"\x40")
+        self.cmd(SSD1306_DISPLAY_ALL_ON_RESUME)
+        self.cmd(SSD1306_NORMAL_DISPLAY)
+        self.cmd(SSD1306_DISPLAY_ON)
 
 
     def show(self):
@@ -134,12 +126,13 @@ class OLED1306(framebuf.FrameBuffer):
             x0 += 32
             x1 += 32
             
-        self.write_command(SSD1306_COLUMN_ADDR)
-        self.write_command(x0)
-        self.write_command(x1)
-        self.write_command(SSD1306_PAGE_ADDR)
-        self.write_command(0x00)
-        self.write_command((self._pages - 1))
+        self.window_buffer[0] = x0
+        self.window_buffer[1] = x1
+        self.cmd(SSD1306_COLUMN_ADDR, self.window_buffer)
+
+        self.window_buffer[0] = 0x00
+        self.window_buffer[1] = (self._pages - 1)
+        self.cmd(SSD1306_PAGE_ADDR, self.window_buffer)
         
         self.dc.value(DAT)
         self.cs.value(LOW)
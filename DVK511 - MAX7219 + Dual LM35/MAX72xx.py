@@ -31,7 +31,7 @@ MAX72xx_Code_B_decode_for_all = const(0xFF)
 
 
 class MAX72xx():
-    def __init__(self, _spi, _csn):
+    def __init__(self, _spi, _csn, no_of_devices = 1):
         self.DIG0 = const(0x08)
         self.DIG1 = const(0x07)
         self.DIG2 = const(0x06)
@@ -43,28 +43,96 @@ class MAX72xx():
         
         self.spi = _spi
         self.csn = Pin(_csn, Pin.OUT)
-        self.buffer = bytearray(0x02)
+        self.devices = no_of_devices
+        self.buffer = bytearray(0x02 * no_of_devices)
+        self.shadow = bytearray(0x08 * no_of_devices)
+        self.dirty = bytearray(0x08 * no_of_devices)
         self.init()
         
         
     def init(self):
         self.csn.on()
-        self.write(MAX72xx_shutdown_reg, MAX72xx_run_cmd)
-        self.write(MAX72xx_decode_mode_reg, MAX72xx_Code_B_decode_for_all)
-        self.write(MAX72xx_scan_limit_reg, MAX72xx_digit_0_to_7)
-        self.write(MAX72xx_intensity_reg, 0x15)
+        self.write_all(MAX72xx_display_test_reg, MAX72xx_no_test_cmd)
+        self.write_all(MAX72xx_shutdown_reg, MAX72xx_run_cmd)
+        self.write_all(MAX72xx_decode_mode_reg, MAX72xx_Code_B_decode_for_all)
+        self.write_all(MAX72xx_scan_limit_reg, MAX72xx_digit_0_to_7)
+        self.write_all(MAX72xx_intensity_reg, 0x15)
         self.clear()
         
     
     def clear(self):
-        for i in range(0x00, 0x09):
-            self.write(i, 0x7F)
+        for i in range(0x01, 0x09):
+            self.write_all(i, 0x7F)
+            
+            
+    def send(self):
+        self.csn.off()
+        self.spi.write(self.buffer)
+        self.csn.on()
         
         
-    def write(self, address, value):
-        self.buffer[0x00] = address
-        self.buffer[0x01] = value
+    def write_all(self, address, value):
+        for i in range(0, len(self.buffer), 2):
+            self.buffer[i] = address
+            self.buffer[(i + 1)] = value
+            
+        if(0x01 <= address <= 0x08):
+            for i in range((address - 1), len(self.shadow), 8):
+                self.shadow[i] = value
+                self.dirty[i] = 0
+            
+        self.send()
         
-        self.csn.off()
-        self.spi.write(self.buffer)
-        self.csn.on()
\ No newline at end of file
+        
+    def write(self, address, value, device = 0):
+        if(0x01 <= address <= 0x08):
+            i = ((device * 8) + address - 1)
+            
+            if((self.shadow[i] == value) and (self.dirty[i] == 0)):
+                return
+            
+            self.shadow[i] = value
+            self.dirty[i] = 0
+        
+        for i in range(0, len(self.buffer)):
+            self.buffer[i] = MAX72xx_NOP
+            
+        i = ((self.devices - 1 - device) * 2)
+        self.buffer[i] = address
+        self.buffer[(i + 1)] = value
+        self.send()
+        
+        
+    def set_row(self, address, value, device = 0):
+        i = ((device * 8) + address - 1)
+        
+        if(self.shadow[i] != value):
+            self.shadow[i] = value
+            self.dirty[i] = 1
+            
+            
+    def load(self, buf):
+        for row in range(0, 8):
+            for device in range(0, self.devices):
+                self.set_row((row + 1), buf[((row * self.devices) + device)], device)
+                
+                
+    def show(self):
+        for row in range(0, 8):
+            changed = False
+            
+            for device in range(0, self.devices):
+                i = ((device * 8) + row)
+                j = ((self.devices - 1 - device) * 2)
+                
+                if(self.dirty[i] != 0):
+                    self.buffer[j] = (row + 1)
+                    self.buffer[(j + 1)] = self.shadow[i]
+                    self.dirty[i] = 0
+                    changed = True
+                else:
+                    self.buffer[j] = MAX72xx_NOP
+                    self.buffer[(j + 1)] = 0x00
+                    
+            if(changed):
+                self.send()
@@ -1,5 +1,5 @@
 from micropython import const
-from machine import Pin, ADC, SoftSPI
+from machine import Pin, ADC, SPI
 from utime import sleep_ms
 from MAX72xx import MAX72xx
 
@@ -7,8 +7,8 @@ from MAX72xx import MAX72xx
 adc0 = ADC(Pin(26))
 adc1 = ADC(Pin(27))
 
-spi = SoftSPI(baudrate=100000, polarity = 0, phase = 0, sck = Pin(10), mosi = Pin(12), miso = Pin(25))
-dis = MAX72xx(spi, 11)
+spi = SPI(1, baudrate = 10000000, polarity = 0, phase = 0, sck = Pin(10), mosi = Pin(11))
+dis = MAX72xx(spi, 12)
 
 
 def map_value_float(v, x_min, x_max, y_min, y_max):
@@ -1,9 +1,17 @@
 from micropython import const
 from machine import Pin
-from utime import sleep_ms, sleep_us
+from rp2 import asm_pio, StateMachine, PIO
+from array import array
 
-                                                                                   
-TM1637_DELAY_US = const(4)
+
+# Each frame is three TX FIFO words holding twelve bytes, shifted out LSB first:
+# a byte count - 1 opens every transfer (start condition) and is followed by
+# the bytes themselves, inverted because DIO is driven open-drain through the
+# pin direction. The three transfers are data command, address + 6 grid bytes
+# and display control. The FIFOs are joined so two whole frames fit in TX;
+# a byte that is not acknowledged raises the state machine's IRQ instead.
+
+TM1637_PIO_FREQ = const(2000000)
 
 TM1637_BRIGHTNESS_MIN = const(0x00)
 TM1637_BRIGHTNESS_1 = const(0x01)
@@ -140,93 +148,91 @@ seg_pos_list = [
 
 
 class TM1637():
-    def __init__(self, _dat_pin, _clk_pin, no_of_displays = TM1637_POSITION_MAX):
-        self.dat_pin = Pin(_dat_pin, Pin.OUT)
+    @asm_pio(out_shiftdir = PIO.SHIFT_RIGHT,
+         autopull = True,
+         pull_thresh = 32,
+         out_init = PIO.IN_LOW,
+         set_init = PIO.IN_LOW,
+         sideset_init = PIO.OUT_HIGH,
+         fifo_join = PIO.JOIN_TX)
+
+    def tm1637_write():
+        wrap_target()
+        out(x, 8)              .side(1)      # bytes in this transfer - 1
+        set(pindirs, 1)        .side(1) [7]  # start: DIO low while CLK high
+        label('byte')
+        set(y, 7)              .side(0) [7]
+        label('bit')
+        nop()                  .side(0) [7]  # CLK low first
+        out(pindirs, 1)        .side(0) [7]  # data bit while CLK low
+        jmp(y_dec, 'bit')      .side(1) [7]
+        nop()                  .side(0) [7]
+        set(pindirs, 0)        .side(0) [7]  # release DIO for the ACK
+        jmp(pin, 'nack')       .side(1) [7]  # DIO still high on the 9th clock
+        label('next')
+        jmp(x_dec, 'byte')     .side(0) [7]
+        set(pindirs, 1)        .side(0) [7]
+        nop()                  .side(1) [7]
+        set(pindirs, 0)        .side(1) [7]  # stop: DIO high while CLK high
+        wrap()
+        label('nack')
+        irq(rel(0))            .side(1)
+        jmp('next')            .side(1)
+
+
+    def __init__(self, _dat_pin, _clk_pin, no_of_displays = TM1637_POSITION_MAX, sm_id = 0):
+        self.dat_pin = Pin(_dat_pin, Pin.IN, Pin.PULL_UP)
         self.clk_pin = Pin(_clk_pin, Pin.OUT)
         self.seg_max_cnt = no_of_displays
         
-        self.init()
+        self.frame = bytearray(TM1637_POSITION_MAX)
+        self.words = array('I', [0, 0, 0])
+        self.words[0] = (((TM1637_CMD_SET_DATA | TM1637_SET_DATA_WRITE | TM1637_SET_DATA_A_ADDR) ^ 0xFF) << 8)
+        self.words[0] |= ((TM1637_POSITION_MAX << 16) | ((TM1637_CMD_SET_ADDR ^ 0xFF) << 24))
+        self.control = (TM1637_CMD_SET_DISPLAY | TM1637_BRIGHTNESS_4 | TM1637_SET_DISPLAY_ON)
+        self.nacks = 0
         
+        self.sm = StateMachine(sm_id, TM1637.tm1637_write, freq = TM1637_PIO_FREQ, out_base = self.dat_pin, set_base = self.dat_pin, sideset_base = self.clk_pin, jmp_pin = self.dat_pin)
+        self.sm.irq(self.nack)
+        self.sm.active(1)
         
-    def init(self):
-        self.dat_pin.init(Pin.OUT, Pin.PULL_DOWN)
+        self.init()
         
-        self.dat_pin.off()
-        self.clk_pin.off()
         
-        self.send_command(TM1637_CMD_SET_DISPLAY | TM1637_BRIGHTNESS_4 | TM1637_SET_DISPLAY_ON)
+    def init(self):
         self.clear()
         
         
-    def start(self):
-        self.dat_pin.init(Pin.OUT, Pin.PULL_DOWN)
-        
-        self.dat_pin.on()
-        self.clk_pin.on()
-        sleep_us(TM1637_DELAY_US)
-        self.dat_pin.off()
+    def nack(self, sm):
+        self.nacks += 1
         
         
-    def stop(self):
-        self.dat_pin.init(Pin.OUT, Pin.PULL_DOWN)
+    def show(self):
+        f = self.frame
+        self.words[1] = ((f[0] | (f[1] << 8) | (f[2] << 16) | (f[3] << 24)) ^ 0xFFFFFFFF)
+        self.words[2] = ((f[4] | (f[5] << 8)) ^ 0xFFFF) | ((self.control ^ 0xFF) << 24)
+        self.sm.put(self.words)
         
-        self.clk_pin.off()
-        sleep_us(TM1637_DELAY_US)
-        self.dat_pin.off()
-        sleep_us(TM1637_DELAY_US)
-        self.clk_pin.on()
-        sleep_us(TM1637_DELAY_US)
-        self.dat_pin.on()
         
-    
-    def write(self, value):
-        self.dat_pin.init(Pin.OUT, Pin.PULL_DOWN)
-        
-        i = 0
-        ack = 0
-        
-        for i in range (0, 8):
-            self.clk_pin.off()
-            sleep_us(TM1637_DELAY_US)
-            self.dat_pin(value & 0x01)
-            self.clk_pin.on()
-            sleep_us(TM1637_DELAY_US)
-            value >>= 1
-            
-        self.clk_pin.off()
-        sleep_us(TM1637_DELAY_US)
-        
-        self.dat_pin.init(Pin.IN, Pin.PULL_UP)
-
-        ack = self.dat_pin.value()
-        
-        if(ack != 0):
-            self.dat_pin.init(Pin.OUT, Pin.PULL_DOWN)
-            self.dat_pin.off()
-            
-        self.dat_pin.init(Pin.OUT, Pin.PULL_DOWN)
-        sleep_us(TM1637_DELAY_US)
-        
-        self.clk_pin.on()
-        sleep_us(TM1637_DELAY_US)
-        self.clk_pin.off()
-        sleep_us(TM1637_DELAY_US)
-        
-        return ack
+    def status(self):
+        nacks = self.nacks
+        self.nacks = 0
+        return nacks
     
     
-    def send_command(self, value):
-        self.start()
-        self.write(value)
-        self.stop()
+    def set_brightness(self, value, state = TM1637_SET_DISPLAY_ON):
+        self.control = (TM1637_CMD_SET_DISPLAY | (value & TM1637_BRIGHTNESS_MAX) | state)
+        self.show()
         
     
     def clear(self):
-        for i in range(0, self.seg_max_cnt):
-            self.display(i , ' ', 0x00)
+        for i in range(0, TM1637_POSITION_MAX):
+            self.frame[i] = 0x00
+        
+        self.show()
             
             
-    def display(self, pos, seg_code, dot_state):
+    def set_digit(self, pos, seg_code, dot_state):
         temp = 0
     
         temp = seg_code_list[((ord(seg_code)) - 0x20)]
@@ -234,14 +240,19 @@ class TM1637():
         if(dot_state == 1):
             temp |= seg_code_list[14]
         
-        self.send_command(TM1637_CMD_SET_DATA | TM1637_SET_DATA_F_ADDR)
-        self.start()
-        self.write(TM1637_CMD_SET_ADDR | seg_pos_list[pos])
-        self.write(temp)
-        self.stop()
+        self.frame[seg_pos_list[pos]] = temp
+            
+            
+    def display(self, pos, seg_code, dot_state):
+        self.set_digit(pos, seg_code, dot_state)
+        self.show()
         
         
     def put_str(self, pos, ch):
         for chr in ch:
-            self.display(pos, chr, 0)
+            if(pos < self.seg_max_cnt):
+                self.set_digit(pos, chr, 0)
+            
             pos += 1
+            
+        self.show()
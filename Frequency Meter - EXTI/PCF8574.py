@@ -6,9 +6,14 @@ class PCF8574_IO():
     def __init__(self, i2c, i2c_addr):        
         self.i2c = i2c
         self.i2c_addr = i2c_addr
+        self.buffer = bytearray(1)
 
     def PCF8574_write_byte(self, value):        
-        self.i2c.writeto(self.i2c_addr, bytes([value]))
+        self.buffer[0] = value
+        self.i2c.writeto(self.i2c_addr, self.buffer)
+        
+    def PCF8574_write_bytes(self, values):        
+        self.i2c.writeto(self.i2c_addr, values)
         
     def PCF8574_read_byte(self, mask):        
         self.PCF8574_write_byte(mask)
@@ -34,7 +34,7 @@ def interrupt_handler(pin):
 interrupt_channel.irq(trigger = Pin.IRQ_FALLING, handler = interrupt_handler)
 
 
-lcd.clr_home
+lcd.clr_home()
 lcd.goto_pos(0, 0)
 lcd.put_str("Frequency/Hz:")
 
@@ -1,7 +1,9 @@
 from micropython import const
-from machine import Pin, SPI
-from utime import sleep_ms
+from machine import Pin, SPI, mem32
+from utime import sleep_ms, sleep_us
 import framebuf
+import rp2
+import sys
 
 
 ST7789_DC_pin = const(8)
@@ -112,6 +114,30 @@ ST7789_PROMACT = const(0xFE)
 ST7789_TFT_WIDTH = const(320)
 ST7789_TFT_HEIGHT = const(240)
 
+ST7789_GRAM_LINES = const(320)
+ST7789_X_OFFSET = const(0)
+ST7789_Y_OFFSET = const(0)
+ST7789_SCROLL_MIRROR = const(1)
+
+ST7789_INIT_SEQ = (
+    (ST7789_MADCTL, b"\xA0", 0),
+    (ST7789_COLMOD, b"\x05", 0),
+    (ST7789_PORCTRL, b"\x0C\x0C\x00\x33\x33", 0),
+    (ST7789_GCTRL, b"\x35", 0),
+    (ST7789_VCOMS, b"\x19", 0),
+    (ST7789_LCMCTRL, b"\x2C", 0),
+    (ST7789_VDVVRHEN, b"\x01", 0),
+    (ST7789_VRHS, b"\x12", 0),
+    (ST7789_VDVSET, b"\x20", 0),
+    (ST7789_FRCTR2, b"\x0F", 0),
+    (ST7789_PWCTRL1, b"\xA4\xA1", 0),
+    (ST7789_PVGAMCTRL, b"\xD0\x04\x0D\x11\x13\x2B\x3F\x54\x4C\x18\x0D\x0B\x1F\x23", 0),
+    (ST7789_NVGAMCTRL, b"\xD0\x04\x0C\x11\x13\x2C\x3F\x44\x51\x2F\x1F\x1F\x20\x23", 0),
+    (ST7789_INVON, b"", 0),
+    (ST7789_SLPOUT, b"", 5),
+    (ST7789_DISPON, b"", 0),
+)
+
 CMD = False
 DAT = True
 
@@ -119,6 +145,18 @@ LOW = False
 HIGH = True
 
 
+SPI_SSPDR = const(0x008)
+SPI_SSPSR = const(0x00C)
+SPI_SSPSR_BSY = const(0x10)
+
+if('RP2350' in sys.implementation._machine):
+    SPI_BASE = (0x40080000, 0x40088000)
+    SPI_TX_DREQ = (24, 26)
+else:
+    SPI_BASE = (0x4003C000, 0x40040000)
+    SPI_TX_DREQ = (16, 18)
+
+
 class TFT2_8(framebuf.FrameBuffer):
     
     def __init__(self):
@@ -146,6 +184,18 @@ class TFT2_8(framebuf.FrameBuffer):
         self.ST7789_SPI = SPI(1, 10000_000, polarity = False, phase = False, sck = self.ST7789_SCK, mosi = self.ST7789_MOSI, miso = None)
         
         self.ST7789_DC = Pin(ST7789_DC_pin, Pin.OUT)
+        self.command_buffer = bytearray(1)
+        self.window_buffer = bytearray(4)
+        self.scroll_buffer = bytearray(2)
+        self.dma = rp2.DMA()
+        self.dma_ctrl = self.dma.pack_ctrl(size = 0, inc_write = False, treq_sel = SPI_TX_DREQ[1], irq_quiet = False)
+        self.dma.irq(handler = self.dma_done, hard = False)
+        self.dma_active = False
+        self.dma_callback = None
+
+        self.scroll_top = 0
+        self.scroll_height = ST7789_GRAM_LINES
+        self.scroll_start = 0
 
         self.buffer = bytearray(self.height * self.width * 2)
         super().__init__(self.buffer, self.width, self.height, framebuf.RGB565)
@@ -156,110 +206,55 @@ class TFT2_8(framebuf.FrameBuffer):
     def disp_reset(self):
         self.ST7789_RST.value(HIGH)
         self.ST7789_RST.value(LOW)
+        sleep_us(10)
         self.ST7789_RST.value(HIGH)
+        sleep_ms(120)
         self.ST7789_BL.value(HIGH)
 
 
     def send(self, value, mode):
         self.ST7789_DC.value(mode)
         self.ST7789_CS.value(LOW)
-        self.ST7789_SPI.write(bytearray([value]))
+        self.command_buffer[0] = value
+        self.ST7789_SPI.write(self.command_buffer)
+        self.ST7789_CS.value(HIGH)
+
+
+    def cmd(self, command, data = b""):
+        self.ST7789_CS.value(LOW)
+        self.ST7789_DC.value(CMD)
+        self.command_buffer[0] = command
+        self.ST7789_SPI.write(self.command_buffer)
+
+        if(len(data) > 0):
+            self.ST7789_DC.value(DAT)
+            self.ST7789_SPI.write(data)
+
         self.ST7789_CS.value(HIGH)
 
 
+    def send_sequence(self, sequence):
+        for command, parameters, delay in sequence:
+            self.cmd(command, parameters)
+
+            if(delay > 0):
+                sleep_ms(delay)
+
+
     def TFT_init(self):
         self.disp_reset()
+        self.send_sequence(ST7789_INIT_SEQ)
 
-        self.send(ST7789_MADCTL, CMD)
-        self.send(0xA0, DAT)
-
-        self.send(ST7789_COLMOD, CMD)
-        self.send(0x05, DAT)
-
-        self.send(ST7789_PORCTRL, CMD)
-        self.send(0x0C, DAT)
-        self.send(0x0C, DAT)
-        self.send(0x00, DAT)
-        self.send(0x33, DAT)
-        self.send(0x33, DAT)
-
-        self.send(ST7789_GCTRL, CMD)
-        self.send(0x35, DAT)
-
-        self.send(ST7789_VCOMS, CMD)
-        self.send(0x19, DAT)
-
-        self.send(ST7789_LCMCTRL, CMD)
-        self.send(0x2C, DAT)
-
-        self.send(ST7789_VDVVRHEN, CMD)
-        self.send(0x01, DAT)
-
-        self.send(ST7789_VRHS, CMD)
-        self.send(0x12, DAT)
-
-        self.send(ST7789_VDVSET, CMD)
-        self.send(0x20, DAT)
-
-        self.send(ST7789_FRCTR2, CMD)
-        self.send(0x0F, DAT)
-
-        self.send(ST7789_PWCTRL1, CMD)
-        self.send(0xA4, DAT)
-        self.send(0xA1, DAT)
-
-        self.send(ST7789_PVGAMCTRL, CMD)
-        self.send(0xD0, DAT)
-        self.send(0x04, DAT)
-        self.send(0x0D, DAT)
-        self.send(0x11, DAT)
-        self.send(0x13, DAT)
-        self.send(0x2B, DAT)
-        self.send(0x3F, DAT)
-        self.send(0x54, DAT)
-        self.send(0x4C, DAT)
-        self.send(0x18, DAT)
-        self.send(0x0D, DAT)
-        self.send(0x0B, DAT)
-        self.send(0x1F, DAT)
-        self.send(0x23, DAT)
-
-        self.send(ST7789_NVGAMCTRL, CMD)
-        self.send(0xD0, DAT)
-        self.send(0x04, DAT)
-        self.send(0x0C, DAT)
-        self.send(0x11, DAT)
-        self.send(0x13, DAT)
-        self.send(0x2C, DAT)
-        self.send(0x3F, DAT)
-        self.send(0x44, DAT)
-        self.send(0x51, DAT)
-        self.send(0x2F, DAT)
-        self.send(0x1F, DAT)
-        self.send(0x1F, DAT)
-        self.send(0x20, DAT)
-        self.send(0x23, DAT)
-
-        self.send(ST7789_INVON, CMD)
-        self.send(ST7789_SLPOUT, CMD)
-        self.send(ST7789_DISPON, CMD)
 
+    def set_RAM_address(self):
+        self.cmd(ST7789_CASET, b"\x00\x00\x01\x40")
+        self.cmd(ST7789_RASET, b"\x00\x00\x00\xF0")
+        self.cmd(ST7789_RAMWR)
 
-    def show(self):
-    	self.send(ST7789_CASET, CMD)
-    	self.send(0x00, DAT)
-        self.send(0x00, DAT)
-        self.send(0x01, DAT)
-        self.send(0x40, DAT)
-        
-        self.send(ST7789_RASET, CMD)
-        self.send(0x00, DAT)
-        self.send(0x00, DAT)
-        self.send(0x00, DAT)
-        self.send(0xF0, DAT)
-        
 
-        self.send(ST7789_RAMWR, CMD)
+    def show(self):
+        self.wait()
+        self.set_RAM_address()
 
         self.ST7789_DC.value(DAT)
         self.ST7789_CS.value(LOW)
@@ -267,4 +262,102 @@ class TFT2_8(framebuf.FrameBuffer):
         self.ST7789_CS.value(HIGH)
 
 
+    def busy(self):
+        return self.dma_active
+
+
+    def wait(self):
+        while(self.dma_active):
+            pass
+
+
+    def dma_done(self, dma):
+        while(mem32[SPI_BASE[1] + SPI_SSPSR] & SPI_SSPSR_BSY):
+            pass
+
+        self.ST7789_CS.value(HIGH)
+        self.dma_active = False
+
+        if(self.dma_callback != None):
+            self.dma_callback()
+
+
+    def start_dma(self, data, callback):
+        self.dma_callback = callback
+        self.dma_active = True
+
+        self.ST7789_DC.value(DAT)
+        self.ST7789_CS.value(LOW)
+        self.dma.config(read = data, write = (SPI_BASE[1] + SPI_SSPDR), count = len(data), ctrl = self.dma_ctrl, trigger = True)
+
+
+    def show_async(self, callback = None):
+        self.wait()
+        self.set_RAM_address()
+        self.start_dma(self.buffer, callback)
+
+
+    def set_window(self, x0, y0, x1, y1):
+        x0 += ST7789_X_OFFSET
+        x1 += ST7789_X_OFFSET
+        y0 += ST7789_Y_OFFSET
+        y1 += ST7789_Y_OFFSET
+
+        self.window_buffer[0] = (x0 >> 8)
+        self.window_buffer[1] = (x0 & 0xFF)
+        self.window_buffer[2] = (x1 >> 8)
+        self.window_buffer[3] = (x1 & 0xFF)
+        self.cmd(ST7789_CASET, self.window_buffer)
+
+        self.window_buffer[0] = (y0 >> 8)
+        self.window_buffer[1] = (y0 & 0xFF)
+        self.window_buffer[2] = (y1 >> 8)
+        self.window_buffer[3] = (y1 & 0xFF)
+        self.cmd(ST7789_RASET, self.window_buffer)
+
+        self.cmd(ST7789_RAMWR)
+
+
+    def set_scroll_area(self, top, height, bottom):
+        self.wait()
+
+        self.cmd(ST7789_VSCRDEF, bytes(((top >> 8), (top & 0xFF), (height >> 8), (height & 0xFF), (bottom >> 8), (bottom & 0xFF))))
+
+        self.scroll_top = top
+        self.scroll_height = height
+        self.scroll_to(top)
+
+
+    def scroll_to(self, line):
+        self.wait()
+
+        self.scroll_buffer[0] = (line >> 8)
+        self.scroll_buffer[1] = (line & 0xFF)
+        self.cmd(ST7789_VSCRSADD, self.scroll_buffer)
+
+        self.scroll_start = line
+
+
+    def scroll_push(self, data):
+        line = self.scroll_start
+
+        if(ST7789_SCROLL_MIRROR):
+            x = ((ST7789_GRAM_LINES - 1) - line - ST7789_X_OFFSET)
+        else:
+            x = (line - ST7789_X_OFFSET)
+
+        self.wait()
+        self.set_window(x, 0, x, (self.height - 1))
+
+        self.ST7789_DC.value(DAT)
+        self.ST7789_CS.value(LOW)
+        self.ST7789_SPI.write(data)
+        self.ST7789_CS.value(HIGH)
+
+        line += 1
+        if(line >= (self.scroll_top + self.scroll_height)):
+            line = self.scroll_top
+
+        self.scroll_to(line)
 
+        return x
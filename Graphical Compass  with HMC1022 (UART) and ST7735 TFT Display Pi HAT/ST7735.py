@@ -1,7 +1,9 @@
 from micropython import const
-from machine import Pin, SPI
-from utime import sleep_ms
+from machine import Pin, SPI, mem32
+from utime import sleep_ms, sleep_us
 import framebuf
+import rp2
+import sys
 
 
 ST7735_DC_pin = const(28)
@@ -77,6 +79,25 @@ ST7735_MADCTL_MH = const(0x04)
 ST7735_TFT_WIDTH = const(128)
 ST7735_TFT_HEIGHT = const(128)
 
+ST7735_INIT_SEQ = (
+    (ST7735_SLPOUT, b"", 120),
+    (ST7735_FRMCTR1, b"\x01\x2C\x2D", 0),
+    (ST7735_FRMCTR2, b"\x01\x2C\x2D", 0),
+    (ST7735_FRMCTR3, b"\x01\x2C\x2D\x01\x2C\x2D", 0),
+    (ST7735_INVCTR, b"\x07", 0),
+    (ST7735_PWCTR1, b"\xA2\x02\x84", 0),
+    (ST7735_PWCTR2, b"\xC5", 0),
+    (ST7735_PWCTR3, b"\x0A\x00", 0),
+    (ST7735_PWCTR4, b"\x8A\x2A", 0),
+    (ST7735_PWCTR5, b"\x8A\xEE", 0),
+    (ST7735_VMCTR1, b"\x0E", 0),
+    (ST7735_GMCTRP1, b"\x0F\x1A\x0F\x18\x2F\x28\x20\x22\x1F\x1B\x23\x37\x00\x07\x02\x10", 0),
+    (ST7735_GMCTRN1, b"\x0F\x1B\x0F\x17\x33\x2C\x29\x2E\x30\x30\x39\x3F\x00\x07\x03\x10", 0),
+    (ST7735_COLMOD, b"\x05", 0),
+    (ST7735_MADCTL, bytes([ST7735_MADCTL_MV | ST7735_MADCTL_MY | ST7735_MADCTL_RGB]), 0),
+    (ST7735_DISPON, b"", 0),
+)
+
 CMD = False
 DAT = True
 
@@ -84,6 +105,18 @@ LOW = False
 HIGH = True
 
 
+SPI_SSPDR = const(0x008)
+SPI_SSPSR = const(0x00C)
+SPI_SSPSR_BSY = const(0x10)
+
+if('RP2350' in sys.implementation._machine):
+    SPI_BASE = (0x40080000, 0x40088000)
+    SPI_TX_DREQ = (24, 26)
+else:
+    SPI_BASE = (0x4003C000, 0x40040000)
+    SPI_TX_DREQ = (16, 18)
+
+
 class TFT_144(framebuf.FrameBuffer):
     
     def __init__(self):
@@ -114,8 +147,16 @@ class TFT_144(framebuf.FrameBuffer):
         self.ST7735_SPI = SPI(1, 10000000, polarity = False, phase = False, sck = self.ST7735_SCK, mosi = self.ST7735_MOSI, miso = None)
         
         self.ST7735_DC = Pin(ST7735_DC_pin, Pin.OUT)
+        self.command_buffer = bytearray(1)
+        self.window_buffer = bytearray(4)
+        self.dma = rp2.DMA()
+        self.dma_ctrl = self.dma.pack_ctrl(size = 0, inc_write = False, treq_sel = SPI_TX_DREQ[1], irq_quiet = False)
+        self.dma.irq(handler = self.dma_done, hard = False)
+        self.dma_active = False
+        self.dma_callback = None
         
         self.buffer = bytearray(self.height * self.width * 2)
+        self.layer = None
         super().__init__(self.buffer, self.width, self.height, framebuf.RGB565)
         
         self.TFT_init()
@@ -124,130 +165,61 @@ class TFT_144(framebuf.FrameBuffer):
         
     def disp_reset(self):
         self.ST7735_RST.value(HIGH)
-        sleep_ms(200)
         self.ST7735_RST.value(LOW)
-        sleep_ms(200)
+        sleep_us(10)
         self.ST7735_RST.value(HIGH)
-        sleep_ms(200)
-        
+        sleep_ms(120)
+
 
     def send(self, value, mode):
         self.ST7735_CS.value(LOW)
         self.ST7735_DC.value(mode)
-        self.ST7735_SPI.write(bytearray([value]))
+        self.command_buffer[0] = value
+        self.ST7735_SPI.write(self.command_buffer)
         self.ST7735_CS.value(HIGH)
         
         
+    def cmd(self, command, data = b""):
+        self.ST7735_CS.value(LOW)
+        self.ST7735_DC.value(CMD)
+        self.command_buffer[0] = command
+        self.ST7735_SPI.write(self.command_buffer)
+
+        if(len(data) > 0):
+            self.ST7735_DC.value(DAT)
+            self.ST7735_SPI.write(data)
+
+        self.ST7735_CS.value(HIGH)
+
+
+    def send_sequence(self, sequence):
+        for command, parameters, delay in sequence:
+            self.cmd(command, parameters)
+
+            if(delay > 0):
+                sleep_ms(delay)
+
+
     def TFT_init(self):
         self.disp_reset()
         self.ST7735_BL.value(HIGH)
-        self.send(ST7735_SLPOUT, CMD)
-        sleep_ms(120)
-        
-        self.send(ST7735_FRMCTR1, CMD)
-        self.send(0x01, DAT)
-        self.send(0x2C, DAT)
-        self.send(0x2D, DAT)
-        
-        self.send(ST7735_FRMCTR2, CMD)
-        self.send(0x01, DAT)
-        self.send(0x2C, DAT)
-        self.send(0x2D, DAT)
-        
-        self.send(ST7735_FRMCTR3, CMD)
-        self.send(0x01, DAT)
-        self.send(0x2C, DAT)
-        self.send(0x2D, DAT)
-        self.send(0x01, DAT)
-        self.send(0x2C, DAT)
-        self.send(0x2D, DAT)
-
-        self.send(ST7735_INVCTR, CMD)
-        self.send(0x07, DAT)
-
-        self.send(ST7735_PWCTR1, CMD)
-        self.send(0xA2, DAT) 
-        self.send(0x02, DAT) 
-        self.send(0x84, DAT)
-        
-        self.send(ST7735_PWCTR2, CMD)
-        self.send(0xC5, DAT)
-
-        self.send(ST7735_PWCTR3, CMD)
-        self.send(0x0A, DAT)
-        self.send(0x00, DAT)
+        self.send_sequence(ST7735_INIT_SEQ)
 
-        self.send(ST7735_PWCTR4, CMD)
-        self.send(0x8A, DAT)
-        self.send(0x2A, DAT)
 
-        self.send(ST7735_PWCTR5, CMD)
-        self.send(0x8A, DAT)
-        self.send(0xEE, DAT)
+    def set_windows(self, xs, ys, xe, ye):
+        self.window_buffer[0] = 0x00
+        self.window_buffer[1] = ((xs & 0xFF) + 0x02)
+        self.window_buffer[2] = 0x00
+        self.window_buffer[3] = ((xe & 0xFF) + 0x02)
+        self.cmd(ST7735_CASET, self.window_buffer)
 
-        self.send(ST7735_VMCTR1, CMD)
-        self.send(0x0E, DAT)
-        
-        self.send(ST7735_GMCTRP1, CMD)
-        self.send(0x0F, DAT)
-        self.send(0x1A, DAT)
-        self.send(0x0F, DAT)
-        self.send(0x18, DAT)
-        self.send(0x2F, DAT)
-        self.send(0x28, DAT)
-        self.send(0x20, DAT)
-        self.send(0x22, DAT)
-        self.send(0x1F, DAT)
-        self.send(0x1B, DAT)
-        self.send(0x23, DAT)
-        self.send(0x37, DAT)
-        self.send(0x00, DAT)
-        self.send(0x07, DAT)
-        self.send(0x02, DAT)
-        self.send(0x10, DAT)
-        
-        self.send(ST7735_GMCTRN1, CMD)
-        self.send(0x0F, DAT)
-        self.send(0x1B, DAT)
-        self.send(0x0F, DAT)
-        self.send(0x17, DAT)
-        self.send(0x33, DAT)
-        self.send(0x2C, DAT)
-        self.send(0x29, DAT)
-        self.send(0x2E, DAT)
-        self.send(0x30, DAT)
-        self.send(0x30, DAT)
-        self.send(0x39, DAT)
-        self.send(0x3F, DAT)
-        self.send(0x00, DAT)
-        self.send(0x07, DAT)
-        self.send(0x03, DAT)
-        self.send(0x10, DAT)
-        
-        self.send(ST7735_COLMOD, CMD)
-        self.send(0x05, DAT)
-        
-        self.send(ST7735_MADCTL, CMD)
-        self.send((ST7735_MADCTL_MV | ST7735_MADCTL_MY | ST7735_MADCTL_RGB), DAT)
+        self.window_buffer[0] = 0x00
+        self.window_buffer[1] = ((ys & 0xFF) + 0x01)
+        self.window_buffer[2] = 0x00
+        self.window_buffer[3] = ((ye & 0xFF) + 0x01)
+        self.cmd(ST7735_RASET, self.window_buffer)
 
-        self.send(ST7735_DISPON, CMD)
-        sleep_ms(10)
-        
-        
-    def set_windows(self, xs, ys, xe, ye):
-        self.send(ST7735_CASET, CMD)
-        self.send(0x00, DAT)
-        self.send(((xs & 0xFF) + 0x02), DAT)
-        self.send(0x00, DAT)
-        self.send(((xe & 0xFF) + 0x02), DAT)
-
-        self.send(ST7735_RASET, CMD)
-        self.send(0x00, DAT)
-        self.send(((ys & 0xFF) + 0x01), DAT)
-        self.send(0x00, DAT)
-        self.send(((ye & 0xFF) + 0x01), DAT)
-
-        self.send(ST7735_RAMWR, CMD)
+        self.cmd(ST7735_RAMWR)
         
 
     def set_RAM_address(self):
@@ -255,9 +227,55 @@ class TFT_144(framebuf.FrameBuffer):
         
         
     def show(self):    
+        self.wait()
         self.set_RAM_address()    
         self.ST7735_DC.value(DAT)
         self.ST7735_CS.value(LOW)
         self.ST7735_SPI.write(self.buffer)
         self.ST7735_CS.value(HIGH)
 
+
+    def busy(self):
+        return self.dma_active
+
+
+    def wait(self):
+        while(self.dma_active):
+            pass
+
+
+    def dma_done(self, dma):
+        while(mem32[SPI_BASE[1] + SPI_SSPSR] & SPI_SSPSR_BSY):
+            pass
+
+        self.ST7735_CS.value(HIGH)
+        self.dma_active = False
+
+        if(self.dma_callback != None):
+            self.dma_callback()
+
+
+    def start_dma(self, data, callback):
+        self.dma_callback = callback
+        self.dma_active = True
+
+        self.ST7735_DC.value(DAT)
+        self.ST7735_CS.value(LOW)
+        self.dma.config(read = data, write = (SPI_BASE[1] + SPI_SSPDR), count = len(data), ctrl = self.dma_ctrl, trigger = True)
+
+
+    def show_async(self, callback = None):
+        self.wait()
+        self.set_RAM_address()
+        self.start_dma(self.buffer, callback)
+
+
+    def save_layer(self):
+        if(self.layer == None):
+            self.layer = bytearray(len(self.buffer))
+
+        self.layer[:] = self.buffer
+
+
+    def restore_layer(self):
+        self.buffer[:] = self.layer
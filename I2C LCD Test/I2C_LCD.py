@@ -36,90 +36,125 @@ BL_OFF = const(0)
 DAT = const(1)
 CMD = const(0)
 
-
-io_ex = 0
-bl_state = 0
-data_value = 0
+ddram_columns = const(40)
+lcd_rows = const(2)
+packet_size = const(84)
 
 
 class TWI_LCD():
         
     def __init__(self, i2c, i2c_addr):        
-        global io_ex
-        global data_value
-        global bl_state
-        
         self.i2c = i2c
         self.i2c_addr = i2c_addr        
-        io_ex = PCF8574_IO(i2c, i2c_addr)
-        utime.sleep_ms(10)
+        self.io_ex = PCF8574_IO(i2c, i2c_addr)
+        self.bl_state = BL_ON
+        
+        self.packet = bytearray(packet_size)
+        self.packet_view = memoryview(self.packet)
+        self.count = 0
         
-        bl_state = BL_ON
-        data_value |= 0x04        
-        io_ex.PCF8574_write_byte(data_value)
+        self.shadow = bytearray(b" " * (ddram_columns * lcd_rows))
+        self.address = -1
+        self.x_pos = 0
+        self.y_pos = 0
+        
+        utime.sleep_ms(10)
+        self.io_ex.PCF8574_write_byte(0x04)
         utime.sleep_ms(10)
-        self.send_data(0x33, CMD)
-        self.send_data(0x32, CMD)
+        self.send_nibble(0x03, CMD)
+        utime.sleep_ms(5)
+        self.send_nibble(0x03, CMD)
+        utime.sleep_ms(1)
+        self.send_nibble(0x03, CMD)
+        utime.sleep_ms(1)
+        self.send_nibble(0x02, CMD)
+        utime.sleep_ms(1)
         self.send_data((_4_pin_interface | _2_row_display | _5x7_dots), CMD)
         self.send_data((display_on | cursor_off | blink_off), CMD)
-        self.send_data(clear_display, CMD)
+        self.clr_home()
         self.send_data((cursor_direction_inc | display_no_shift), CMD)
         
-    def send_data(self, send_value, mode):        
-        global data_value
-        global bl_state
-        global io_ex
+    def queue(self, send_value, mode):
+        if((self.count + 4) > packet_size):
+            self.flush()
+            
+        ctrl = mode
+        if(self.bl_state == BL_ON):
+            ctrl |= 0x08
+            
+        hi = ((send_value & 0xF0) | ctrl)
+        lo = (((send_value & 0x0F) << 4) | ctrl)
         
-        if(mode == CMD):
-            data_value &= 0xF4
-        else:
-            data_value |= 0x01
+        self.packet[self.count] = (hi | 0x04)
+        self.packet[self.count + 1] = hi
+        self.packet[self.count + 2] = (lo | 0x04)
+        self.packet[self.count + 3] = lo
+        self.count += 4
+        
+    def queue_nibble(self, send_value, mode):
+        if((self.count + 2) > packet_size):
+            self.flush()
             
-        if(bl_state == BL_ON):
-            data_value |= 0x08
-        else:
-            data_value &= 0xF7
+        ctrl = mode
+        if(self.bl_state == BL_ON):
+            ctrl |= 0x08
             
-        io_ex.PCF8574_write_byte(data_value)
-        self.quad_bit_send(send_value)
-        utime.sleep_ms(1)
+        nibble = (((send_value & 0x0F) << 4) | ctrl)
         
-    def toggle_EN(self):
-        global data_value
-        data_value |= 0x04
-        io_ex.PCF8574_write_byte(data_value)
-        utime.sleep_ms(1)
-        data_value &= 0xF9
-        io_ex.PCF8574_write_byte(data_value)
-        utime.sleep_ms(1)
-
-    def quad_bit_send(self, lcd_data):        
-        global data_value
-        temp = (lcd_data & 0xF0)
-        data_value &= 0x0F
-        data_value |= temp
-        io_ex.PCF8574_write_byte(data_value)
-        self.toggle_EN()        
-        temp = (lcd_data & 0x0F)
-        temp <<= 0x04
-        data_value &= 0x0F
-        data_value |= temp
-        io_ex.PCF8574_write_byte(data_value)
-        self.toggle_EN()
+        self.packet[self.count] = (nibble | 0x04)
+        self.packet[self.count + 1] = nibble
+        self.count += 2
+        
+    def flush(self):
+        if(self.count > 0):
+            self.io_ex.PCF8574_write_bytes(self.packet_view[0:self.count])
+            self.count = 0
+        
+    def send_data(self, send_value, mode):        
+        self.queue(send_value, mode)
+        self.flush()
+        
+    def send_nibble(self, send_value, mode):
+        self.queue_nibble(send_value, mode)
+        self.flush()
         
     def clr_home(self):        
         self.send_data(clear_display, CMD)
-        self.send_data(goto_home, CMD)
+        utime.sleep_ms(2)
+        
+        for i in range(0, len(self.shadow)):
+            self.shadow[i] = 0x20
+            
+        self.address = 0
+        self.x_pos = 0
+        self.y_pos = 0
         
     def goto_xy(self, x_pos, y_pos):        
+        self.x_pos = x_pos
+        
         if(y_pos == 0):
-            self.send_data((0x80 | x_pos), CMD)
+            self.y_pos = 0
         else:
-            self.send_data((0xC0 | x_pos), CMD)
+            self.y_pos = 1
             
     def put_chr(self, ch):        
-        self.send_data(ord(ch), DAT)
+        self.put_str(ch)
             
     def put_str(self, ch_string):        
         for chr in ch_string:
-            self.put_chr(chr)
+            value = ord(chr)
+            
+            if(self.x_pos < ddram_columns):
+                i = ((self.y_pos * ddram_columns) + self.x_pos)
+                
+                if(self.shadow[i] != value):
+                    if(self.address != i):
+                        self.queue((0x80 | (self.y_pos << 6) | self.x_pos), CMD)
+                        
+                    self.queue(value, DAT)
+                    self.shadow[i] = value
+                    self.address = ((i + 1) % len(self.shadow))
+                    
+            self.x_pos += 1
+            
+        self.flush()
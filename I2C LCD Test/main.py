@@ -10,7 +10,7 @@ i = -11.0
 
 lcd = TWI_LCD(lcd_port, 0x27)
 
-lcd.clr_home
+lcd.clr_home()
 lcd.goto_xy(1, 0)
 lcd.put_str("RP2040 uPython")
 
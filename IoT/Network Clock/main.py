@@ -96,6 +96,9 @@ def digital_clock():
 oled.fill(oled.BLACK)
 oled.show()
 
+background()
+oled.save_layer()
+
 
 while(True):
 
@@ -140,7 +143,7 @@ while(True):
                 
             time_fetch_flag = False
             
-    background()
+    oled.restore_layer()
     analogue_clock()
     digital_clock()
     year, month, date, hour, minute, second, weekday, yearday = time.localtime()
@@ -1,7 +1,9 @@
 from micropython import const
-from machine import Pin, SPI
-from utime import sleep_ms
+from machine import Pin, SPI, mem32
+from utime import sleep_ms, sleep_us
 import framebuf
+import rp2
+import sys
 
 
 ST7789_DC_pin = const(17)
@@ -111,6 +113,28 @@ ST7789_PROMACT = const(0xFE)
 ST7789_TFT_WIDTH = const(320)
 ST7789_TFT_HEIGHT = const(200)
 
+ST7789_PALETTE_SIZE = const(16)
+ST7789_PALETTE_LINES = const(10)
+
+ST7789_INIT_SEQ = (
+    (ST7789_PORCTRL, b"\x0C\x0C\x00\x33\x33", 0),
+    (ST7789_GCTRL, b"\x35", 0),
+    (ST7789_VCOMS, b"\x19", 0),
+    (ST7789_LCMCTRL, b"\x2C", 0),
+    (ST7789_VDVVRHEN, b"\x01", 0),
+    (ST7789_VRHS, b"\x12", 0),
+    (ST7789_VDVSET, b"\x20", 0),
+    (ST7789_FRCTR2, b"\x0F", 0),
+    (ST7789_PWCTRL1, b"\xA4\xA1", 0),
+    (ST7789_PVGAMCTRL, b"\xD0\x04\x0D\x11\x13\x2B\x3F\x54\x4C\x18\x0D\x0B\x1F\x23", 0),
+    (ST7789_NVGAMCTRL, b"\xD0\x04\x0C\x11\x13\x2C\x3F\x44\x51\x2F\x1F\x1F\x20\x23", 0),
+    (ST7789_INVON, b"", 0),
+    (ST7789_MADCTL, b"\x70", 0),
+    (ST7789_COLMOD, b"\x05", 0),
+    (ST7789_SLPOUT, b"", 5),
+    (ST7789_DISPON, b"", 0),
+)
+
 CMD = False
 DAT = True
 
@@ -118,9 +142,21 @@ LOW = False
 HIGH = True
 
 
+SPI_SSPDR = const(0x008)
+SPI_SSPSR = const(0x00C)
+SPI_SSPSR_BSY = const(0x10)
+
+if('RP2350' in sys.implementation._machine):
+    SPI_BASE = (0x40080000, 0x40088000)
+    SPI_TX_DREQ = (24, 26)
+else:
+    SPI_BASE = (0x4003C000, 0x40040000)
+    SPI_TX_DREQ = (16, 18)
+
+
 class TFT2in(framebuf.FrameBuffer):
     
-    def __init__(self):
+    def __init__(self, palette_mode = False):
         self.width = ST7789_TFT_WIDTH
         self.height = ST7789_TFT_HEIGHT
 
@@ -146,109 +182,89 @@ class TFT2in(framebuf.FrameBuffer):
         self.ST7789_SPI = SPI(1, 60_000_000, polarity = False, phase = False, sck = self.ST7789_SCK, mosi = self.ST7789_MOSI, miso = None)
         
         self.ST7789_DC = Pin(ST7789_DC_pin, Pin.OUT)
+        self.command_buffer = bytearray(1)
+        self.window_buffer = bytearray(4)
+        self.dma = rp2.DMA()
+        self.dma_ctrl = self.dma.pack_ctrl(size = 0, inc_write = False, treq_sel = SPI_TX_DREQ[1], irq_quiet = False)
+        self.dma.irq(handler = self.dma_done, hard = False)
+        self.dma_active = False
+        self.dma_callback = None
         
-        self.buffer = bytearray(self.height * self.width * 2)
-        super().__init__(self.buffer, self.width, self.height, framebuf.RGB565)
+        self.palette_mode = palette_mode
+
+        if(palette_mode):
+            self.buffer = bytearray((self.height * self.width) // 2)
+            super().__init__(self.buffer, self.width, self.height, framebuf.GS4_HMSB)
+
+            self.palette = framebuf.FrameBuffer(bytearray(ST7789_PALETTE_SIZE * 2), ST7789_PALETTE_SIZE, 1, framebuf.RGB565)
+            self.palette_count = 0
+
+            self.line_buffers = (bytearray(self.width * ST7789_PALETTE_LINES * 2), bytearray(self.width * ST7789_PALETTE_LINES * 2))
+            self.line_views = (memoryview(self.line_buffers[0]), memoryview(self.line_buffers[1]))
+            self.lines = (framebuf.FrameBuffer(self.line_buffers[0], self.width, ST7789_PALETTE_LINES, framebuf.RGB565),
+                          framebuf.FrameBuffer(self.line_buffers[1], self.width, ST7789_PALETTE_LINES, framebuf.RGB565))
+            self.band_y = 0
+            self.band_index = 0
+            self.band_callback = None
+
+            self.BLACK = self.palette_index(self.BLACK)
+            self.BLUE = self.palette_index(self.BLUE)
+            self.RED = self.palette_index(self.RED)
+            self.GREEN = self.palette_index(self.GREEN)
+            self.CYAN = self.palette_index(self.CYAN)
+            self.MAGENTA = self.palette_index(self.MAGENTA)
+            self.YELLOW = self.palette_index(self.YELLOW)
+            self.WHITE = self.palette_index(self.WHITE)
+        else:
+            self.buffer = bytearray(self.height * self.width * 2)
+            super().__init__(self.buffer, self.width, self.height, framebuf.RGB565)
         
         self.TFT_init()
         
         
     def disp_reset(self):
         self.ST7789_RST.value(HIGH)
-        sleep_ms(5)
         self.ST7789_RST.value(LOW)
-        sleep_ms(10)
+        sleep_us(10)
         self.ST7789_RST.value(HIGH)
-        sleep_ms(5)
+        sleep_ms(120)
         self.ST7789_BL.value(HIGH)
 
 
     def send(self, value, mode):
         self.ST7789_DC.value(mode)
         self.ST7789_CS.value(LOW)
-        self.ST7789_SPI.write(bytearray([value]))
+        self.command_buffer[0] = value
+        self.ST7789_SPI.write(self.command_buffer)
+        self.ST7789_CS.value(HIGH)
+
+
+    def cmd(self, command, data = b""):
+        self.ST7789_CS.value(LOW)
+        self.ST7789_DC.value(CMD)
+        self.command_buffer[0] = command
+        self.ST7789_SPI.write(self.command_buffer)
+
+        if(len(data) > 0):
+            self.ST7789_DC.value(DAT)
+            self.ST7789_SPI.write(data)
+
         self.ST7789_CS.value(HIGH)
 
 
+    def send_sequence(self, sequence):
+        for command, parameters, delay in sequence:
+            self.cmd(command, parameters)
+
+            if(delay > 0):
+                sleep_ms(delay)
+
+
     def TFT_init(self):
         self.disp_reset()
-        
-        self.send(ST7789_PORCTRL, CMD)
-        self.send(0x0C, DAT)
-        self.send(0x0C, DAT)
-        self.send(0x00, DAT)
-        self.send(0x33, DAT)
-        self.send(0x33, DAT)
-
-        self.send(ST7789_GCTRL, CMD)
-        self.send(0x35, DAT)
-
-        self.send(ST7789_VCOMS, CMD)
-        self.send(0x19, DAT)
-
-        self.send(ST7789_LCMCTRL, CMD)
-        self.send(0x2C, DAT)
-
-        self.send(ST7789_VDVVRHEN, CMD)
-        self.send(0x01, DAT)
-
-        self.send(ST7789_VRHS, CMD)
-        self.send(0x12, DAT)
-
-        self.send(ST7789_VDVSET, CMD)
-        self.send(0x20, DAT)
-
-        self.send(ST7789_FRCTR2, CMD)
-        self.send(0x0F, DAT)
-
-        self.send(ST7789_PWCTRL1, CMD)
-        self.send(0xA4, DAT)
-        self.send(0xA1, DAT)
-
-        self.send(ST7789_PVGAMCTRL, CMD)
-        self.send(0xD0, DAT)
-        self.send(0x04, DAT)
-        self.send(0x0D, DAT)
-        self.send(0x11, DAT)
-        self.send(0x13, DAT)
-        self.send(0x2B, DAT)
-        self.send(0x3F, DAT)
-        self.send(0x54, DAT)
-        self.send(0x4C, DAT)
-        self.send(0x18, DAT)
-        self.send(0x0D, DAT)
-        self.send(0x0B, DAT)
-        self.send(0x1F, DAT)
-        self.send(0x23, DAT)
-
-        self.send(ST7789_NVGAMCTRL, CMD)
-        self.send(0xD0, DAT)
-        self.send(0x04, DAT)
-        self.send(0x0C, DAT)
-        self.send(0x11, DAT)
-        self.send(0x13, DAT)
-        self.send(0x2C, DAT)
-        self.send(0x3F, DAT)
-        self.send(0x44, DAT)
-        self.send(0x51, DAT)
-        self.send(0x2F, DAT)
-        self.send(0x1F, DAT)
-        self.send(0x1F, DAT)
-        self.send(0x20, DAT)
-        self.send(0x23, DAT)
-
-        self.send(ST7789_INVON, CMD)
-
-        self.send(ST7789_MADCTL, CMD)
-        self.send(0x70, DAT)
-
-        self.send(ST7789_COLMOD, CMD)
-        self.send(0x05, DAT)
-        
-        self.send(ST7789_SLPOUT, CMD)
-        self.send(ST7789_DISPON, CMD)
-        
-        
+        self.send_sequence(ST7789_INIT_SEQ)
+
+
     def colour_generator(self, r, g, b):
         r = (r & 0xF8)
         g = ((g & 0xFC) >> 2)
@@ -258,27 +274,134 @@ class TFT2in(framebuf.FrameBuffer):
         colour |= (b << 8)
         colour |= ((g & 0x38) >> 3)
         colour |= ((g & 0x07) << 13)
+
+        if(self.palette_mode):
+            return self.palette_index(colour)
     
         return colour
 
 
-    def show(self):
-    	self.send(ST7789_CASET, CMD)
-    	self.send(0x00, DAT)
-        self.send(0x00, DAT)
-        self.send(0x01, DAT)
-        self.send(0x40, DAT)
-        
-        self.send(ST7789_RASET, CMD)
-        self.send(0x00, DAT)
-        self.send(0x23, DAT)
-        self.send(0x00, DAT)
-        self.send(0xEB, DAT)
-        
+    def set_palette(self, index, colour):
+        self.palette.pixel(index, 0, colour)
+
+        if(index >= self.palette_count):
+            self.palette_count = (index + 1)
+
+
+    def palette_index(self, colour):
+        for i in range(self.palette_count):
+            if(self.palette.pixel(i, 0) == colour):
+                return i
+
+        if(self.palette_count < ST7789_PALETTE_SIZE):
+            self.set_palette(self.palette_count, colour)
+            return (self.palette_count - 1)
+
+        c = (((colour & 0xFF) << 8) | (colour >> 8))
+        nearest = 0
+        distance = 0x7FFFFFFF
+
+        for i in range(ST7789_PALETTE_SIZE):
+            p = self.palette.pixel(i, 0)
+            p = (((p & 0xFF) << 8) | (p >> 8))
+            dr = ((c >> 11) - (p >> 11)) << 1
+            dg = (((c >> 5) & 0x3F) - ((p >> 5) & 0x3F))
+            db = ((c & 0x1F) - (p & 0x1F)) << 1
+            d = ((dr * dr) + (dg * dg) + (db * db))
+
+            if(d < distance):
+                distance = d
+                nearest = i
+
+        return nearest
+
 
-        self.send(ST7789_RAMWR, CMD)
+    def set_RAM_address(self):
+        self.cmd(ST7789_CASET, b"\x00\x00\x01\x40")
+        self.cmd(ST7789_RASET, b"\x00\x23\x00\xEB")
+        self.cmd(ST7789_RAMWR)
+
+
+    def show(self):
+        self.wait()
+        self.set_RAM_address()
 
         self.ST7789_DC.value(DAT)
         self.ST7789_CS.value(LOW)
-        self.ST7789_SPI.write(self.buffer)
+
+        if(self.palette_mode):
+            for y in range(0, self.height, ST7789_PALETTE_LINES):
+                h = min(ST7789_PALETTE_LINES, (self.height - y))
+                self.expand_band(0, y)
+                self.ST7789_SPI.write(self.line_views[0][0:(self.width * h * 2)])
+        else:
+            self.ST7789_SPI.write(self.buffer)
+
+        self.ST7789_CS.value(HIGH)
+
+
+    def busy(self):
+        return self.dma_active
+
+
+    def wait(self):
+        while(self.dma_active):
+            pass
+
+
+    def dma_done(self, dma):
+        while(mem32[SPI_BASE[1] + SPI_SSPSR] & SPI_SSPSR_BSY):
+            pass
+
         self.ST7789_CS.value(HIGH)
+        self.dma_active = False
+
+        if(self.dma_callback != None):
+            self.dma_callback()
+
+
+    def start_dma(self, data, callback):
+        self.dma_callback = callback
+        self.dma_active = True
+
+        self.ST7789_DC.value(DAT)
+        self.ST7789_CS.value(LOW)
+        self.dma.config(read = data, write = (SPI_BASE[1] + SPI_SSPDR), count = len(data), ctrl = self.dma_ctrl, trigger = True)
+
+
+    def expand_band(self, index, y):
+        self.lines[index].blit(self, 0, -y, -1, self.palette)
+
+
+    def next_band(self):
+        y = self.band_y
+
+        if(y >= self.height):
+            if(self.band_callback != None):
+                self.band_callback()
+            return
+
+        h = min(ST7789_PALETTE_LINES, (self.height - y))
+        self.start_dma(self.line_views[self.band_index][0:(self.width * h * 2)], self.next_band)
+
+        self.band_y = (y + ST7789_PALETTE_LINES)
+        self.band_index ^= 1
+
+        if(self.band_y < self.height):
+            self.expand_band(self.band_index, self.band_y)
+
+
+    def show_async(self, callback = None):
+        self.wait()
+
+        if(self.palette_mode):
+            self.set_RAM_address()
+            self.band_callback = callback
+            self.band_y = 0
+            self.band_index = 0
+            self.expand_band(0, 0)
+            self.next_band()
+            return
+
+        self.set_RAM_address()
+        self.start_dma(self.buffer, callback)
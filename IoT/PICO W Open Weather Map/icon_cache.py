@@ -0,0 +1,136 @@
+from micropython import const
+from ucollections import OrderedDict
+from struct import pack, unpack
+import framebuf
+import os
+
+
+ICON_CACHE_MAGIC = b"ICN1"
+ICON_CACHE_HEADER_SIZE = const(8)
+ICON_CACHE_PALETTE_SIZE = const(16)
+
+
+class icon_cache():
+    def __init__(self, tft, budget = 16384, path = "icons"):
+        self.tft = tft
+        self.budget = budget
+        self.path = path
+        self.used = 0
+        self.cache = OrderedDict()
+        self.palette_mode = tft.palette_mode
+        
+        if(self.palette_mode):
+            self.format = framebuf.GS4_HMSB
+        else:
+            self.format = framebuf.RGB565
+            
+        if(path != None):
+            try:
+                os.mkdir(path)
+            except OSError:
+                pass
+            
+            
+    def sprite_length(self, width, height):
+        if(self.palette_mode):
+            return (((width + 1) >> 1) * height)
+        
+        return (width * height * 2)
+    
+    
+    def file_name(self, code, width, height):
+        return ("%s/%s_%ux%u.bin" % (self.path, code, width, height))
+    
+    
+    def load(self, code, width, height):
+        data = bytearray(self.sprite_length(width, height))
+        
+        try:
+            with open(self.file_name(code, width, height), "rb") as f:
+                header = f.read(ICON_CACHE_HEADER_SIZE)
+                
+                if((header[0:4] != ICON_CACHE_MAGIC) or (unpack("<HH", header[4:8]) != (width, height))):
+                    return None
+                
+                if(self.palette_mode):
+                    palette = unpack("<16H", f.read(ICON_CACHE_PALETTE_SIZE * 2))
+                    
+                if(f.readinto(data) != len(data)):
+                    return None
+        except OSError:
+            return None
+        
+        if(self.palette_mode):
+            self.remap(data, palette)
+            
+        return data
+    
+    
+    def remap(self, data, palette):
+        used = 0
+        for b in data:
+            used |= ((1 << (b >> 4)) | (1 << (b & 0x0F)))
+            
+        index = list(range(ICON_CACHE_PALETTE_SIZE))
+        for i in range(ICON_CACHE_PALETTE_SIZE):
+            if(used & (1 << i)):
+                index[i] = self.tft.palette_index(palette[i])
+                
+        if(index == list(range(ICON_CACHE_PALETTE_SIZE))):
+            return
+        
+        lut = bytearray(256)
+        for b in range(256):
+            lut[b] = ((index[b >> 4] << 4) | index[b & 0x0F])
+            
+        for i in range(len(data)):
+            data[i] = lut[data[i]]
+            
+            
+    def save(self, code, width, height, data):
+        try:
+            with open(self.file_name(code, width, height), "wb") as f:
+                f.write(ICON_CACHE_MAGIC + pack("<HH", width, height))
+                
+                if(self.palette_mode):
+                    f.write(pack("<16H", *[self.tft.palette.pixel(i, 0) for i in range(ICON_CACHE_PALETTE_SIZE)]))
+                    
+                f.write(data)
+        except OSError:
+            pass
+        
+        
+    def build(self, code, width, height, render):
+        data = None
+        
+        if(self.path != None):
+            data = self.load(code, width, height)
+            
+        if(data == None):
+            data = bytearray(self.sprite_length(width, height))
+            render(framebuf.FrameBuffer(data, width, height, self.format), code)
+            
+            if(self.path != None):
+                self.save(code, width, height, data)
+                
+        return (framebuf.FrameBuffer(data, width, height, self.format), len(data))
+    
+    
+    def get(self, code, width, height, render):
+        key = (code, width, height)
+        entry = self.cache.pop(key, None)
+        
+        if(entry == None):
+            entry = self.build(code, width, height, render)
+            self.used += entry[1]
+            
+            while((self.used > self.budget) and (len(self.cache) > 0)):
+                self.used -= self.cache.pop(next(iter(self.cache)))[1]
+                
+        self.cache[key] = entry
+        return entry[0]
+    
+    
+    def clear(self):
+        self.cache = OrderedDict()
+        self.used = 0
@@ -6,6 +6,7 @@ from open_weather_map import open_weather_map
 import Open_Weather_Map_Credentials
 import WiFi_Credentials
 from unix_time import unix 
+from icon_cache import icon_cache
 import network
 import random
 import math
@@ -16,6 +17,10 @@ gc.enable()
 gc.collect()
 wifi_check_interval = const(120000)
 weather_sync_time = const(15)
+icon_x = const(216)
+icon_y = const(12)
+icon_width = const(92)
+icon_height = const(90)
 
 
 
@@ -36,11 +41,12 @@ pi_by_2 = 1.570796327
 weather_data = [0 for _ in range(0, 23)]
 
 
-tft = TFT2in()
+tft = TFT2in(palette_mode = True)
 tft.fill(tft.BLACK)
 rtc = RTC()
 LED = Pin("LED", Pin.OUT)
 ut = unix(6)
+icons = icon_cache(tft)
 owm = open_weather_map(Open_Weather_Map_Credentials.country, Open_Weather_Map_Credentials.city, Open_Weather_Map_Credentials.api_key)
 
 
@@ -161,60 +167,97 @@ def digital_clock(x_pos, y_pos):
     tft.text(str_2, x_pos, (y_pos + 12), tft.WHITE)
     
     
-def cloudy(x_pos, y_pos, size, col1, col2):
-    tft.ellipse(x_pos, y_pos, size, size, tft.colour_generator(col1, col1, col1), True)
-    tft.ellipse((x_pos - 10), (y_pos - 5), size, size, tft.colour_generator(col1, col1, col1), True)
-    tft.ellipse((x_pos + 10), (y_pos - 10), size, size, tft.colour_generator(col2, col2, col2), True)
-    tft.ellipse((x_pos + 20), y_pos, size, size, tft.colour_generator(col2, col2, col2), True)
+def cloudy(fb, x_pos, y_pos, size, col1, col2):
+    fb.ellipse(x_pos, y_pos, size, size, tft.colour_generator(col1, col1, col1), True)
+    fb.ellipse((x_pos - 10), (y_pos - 5), size, size, tft.colour_generator(col1, col1, col1), True)
+    fb.ellipse((x_pos + 10), (y_pos - 10), size, size, tft.colour_generator(col2, col2, col2), True)
+    fb.ellipse((x_pos + 20), y_pos, size, size, tft.colour_generator(col2, col2, col2), True)
     
     
-def sunny(x_pos, y_pos, radius):
-    global conv_factor
-    
-    tft.ellipse(x_pos, y_pos, radius, radius, tft.YELLOW, True)
+def sunny(fb, x_pos, y_pos, radius):
+    fb.ellipse(x_pos, y_pos, radius, radius, tft.YELLOW, True)
     
     size = (radius << 1)
 
     for i in range(0, 360, 30):
-        tft.line(x_pos, y_pos, (x_pos + int(size * math.sin(i * conv_factor))), int(y_pos - (size * math.cos(i * conv_factor))), tft.YELLOW)
+        fb.line(x_pos, y_pos, (x_pos + int(size * math.sin(i * conv_factor_1))), int(y_pos - (size * math.cos(i * conv_factor_1))), tft.YELLOW)
 
 
-def rain(x_pos, y_pos, size = 20):
+def rain(fb, x_pos, y_pos, size = 20):
     gap = (size >> 2)
     
     for i in range(0, 10):
         xpos = random.randrange(x_pos, (x_pos + size))
         ypos = random.randrange(y_pos, (y_pos + size))
-        tft.line(xpos, ypos, (xpos - gap), (ypos - gap), tft.CYAN)
+        fb.line(xpos, ypos, (xpos - gap), (ypos - gap), tft.CYAN)
     
 
-def snow(x_pos, y_pos, size = 20):
+def snow(fb, x_pos, y_pos, size = 20):
     radius = (size // 10)
     
     for i in range(0, 10):
         r = random.randrange(1, radius)
         xpos = random.randrange(x_pos, (x_pos + size))
         ypos = random.randrange(y_pos, (y_pos + size))
-        tft.ellipse(xpos, ypos, r, r, tft.CYAN, True)
+        fb.ellipse(xpos, ypos, r, r, tft.CYAN, True)
     
     
-def lightning(x_pos, y_pos, size = 12):
+def lightning(fb, x_pos, y_pos, size = 12):
     gap = (size >> 1)
     xpos = random.randrange(x_pos, (x_pos + (size << 1)))
     ypos = random.randrange(y_pos, (y_pos + size))
-    tft.line((xpos + gap), ypos, xpos, (ypos + gap), tft.YELLOW)
-    tft.line(xpos, (ypos + gap), (xpos + gap), (ypos + gap), tft.YELLOW)
-    tft.line((xpos + gap), (ypos + gap), xpos, (ypos + (gap << 1)), tft.YELLOW)
+    fb.line((xpos + gap), ypos, xpos, (ypos + gap), tft.YELLOW)
+    fb.line(xpos, (ypos + gap), (xpos + gap), (ypos + gap), tft.YELLOW)
+    fb.line((xpos + gap), (ypos + gap), xpos, (ypos + (gap << 1)), tft.YELLOW)
  
 
-def mist(x_pos, y_pos, size = 40):
+def mist(fb, x_pos, y_pos, size = 40):
     length = (size >> 1)
     gap = (length >> 1)
     
     for i in range(0, gap):
         xpos = random.randrange(x_pos, (x_pos + size), gap)
         ypos = random.randrange(y_pos, (y_pos + size), gap)
-        tft.hline(xpos, ypos, length, tft.GREEN)
+        fb.hline(xpos, ypos, length, tft.GREEN)
+        
+        
+def weather_icon(fb, code):
+    x = (0 - icon_x)
+    y = (0 - icon_y)
+    
+    if(code == "01"):
+        sunny(fb, (x + 260), (y + 55), 20)
+        
+    elif(code == "02"):
+        sunny(fb, (x + 260), (y + 54), 20)
+        cloudy(fb, (x + 270), (y + 60), 15, 165, 165)
+        
+    elif(code == "03"):
+        cloudy(fb, (x + 260), (y + 60), 15, 145, 125)
+        
+    elif(code == "04"):
+        sunny(fb, (x + 260), (y + 55), 20)
+        cloudy(fb, (x + 270), (y + 60), 15, 100, 125)
+    
+    elif(code == "09"):
+        cloudy(fb, (x + 260), (y + 60), 15, 145, 125)
+        rain(fb, (x + 266), (y + 70))
+        
+    elif(code == "10"):
+        cloudy(fb, (x + 260), (y + 60), 15, 125, 125)
+        rain(fb, (x + 264), (y + 70))
+        
+    elif(code == "11"):
+        cloudy(fb, (x + 260), (y + 60), 15, 145, 125)
+        lightning(fb, (x + 250), (y + 70))
+        
+    elif(code == "13"):
+        cloudy(fb, (x + 260), (y + 60), 15, 145, 125)
+        snow(fb, (x + 265), (y + 70))
+        
+    elif(code == "50"):
+        cloudy(fb, (x + 260), (y + 54), 16, 195, 195)
+        mist(fb, (x + 240), (y + 60))
         
         
 def compass(x_pos, y_pos, size, bearing):
@@ -272,39 +315,10 @@ def show_weather_data():
           
     compass(285, 144, 24, weather_data[16])
     
-    if((weather_data[22] == "01d") or (weather_data[22] == "01n")):
-        sunny(260, 55, 20)
-        
-    elif((weather_data[22] == "02d") or (weather_data[22] == "02n")):
-        sunny(260, 54, 20)
-        cloudy(270, 60, 15, 165, 165)
-        
-    elif((weather_data[22] == "03d") or (weather_data[22] == "03n")):
-        cloudy(260, 60, 15, 145, 125)
-        
-    elif((weather_data[22] == "04d") or (weather_data[22] == "04n")):
-        sunny(260, 55, 20)
-        cloudy(270, 60, 15, 100, 125)
+    code = weather_data[22]
     
-    elif((weather_data[22] == "09d") or (weather_data[22] == "09n")):
-        cloudy(260, 60, 15, 145, 125)
-        rain(266, 70)
-        
-    elif((weather_data[22] == "10d") or (weather_data[22] == "10n")):
-        cloudy(260, 60, 15, 125, 125)
-        rain(264, 70)
-        
-    elif((weather_data[22] == "11d") or (weather_data[22] == "11n")):
-        cloudy(260, 60, 15, 145, 125)
-        lightning(250, 70)
-        
-    elif((weather_data[22] == "13d") or (weather_data[22] == "13n")):
-        cloudy(260, 60, 15, 145, 125)
-        snow(265, 70)
-        
-    elif((weather_data[22] == "50d") or (weather_data[22] == "50n")):
-        cloudy(260, 54, 16, 195, 195)
-        mist(240, 60)
+    if(isinstance(code, str)):
+        tft.blit(icons.get(code[0:2], icon_width, icon_height, weather_icon), icon_x, icon_y, tft.BLACK)
 
 
 gc.collect()
@@ -315,14 +329,15 @@ while(True):
     gc.collect()
     check_connection(wlan)
     LED.on()
-    tft.fill(tft.BLACK)
-    tft.text("Raspberry Pi PICO W Open Weather Map", 15, 10, tft.WHITE)    
     report_time() 
     get_weather()
+    tft.wait()
+    tft.fill(tft.BLACK)
+    tft.text("Raspberry Pi PICO W Open Weather Map", 15, 10, tft.WHITE)    
     show_weather_data()
     digital_clock(10, 140)
     analog_clock(50, 80, 40)    
-    tft.show()
+    tft.show_async()
     sleep_ms(400)
     LED.off()
     sleep_ms(600)
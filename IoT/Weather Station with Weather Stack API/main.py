@@ -64,9 +64,12 @@ def background():
 tft.fill(tft.BLACK)
 tft.display()
 
+background()
+tft.save_layer()
+
 
 while(True):
-    background()
+    tft.restore_layer()
 
     if(((minute % 10) == 0) and (second == 30)):
         if(esp.get_connection_status() == False):
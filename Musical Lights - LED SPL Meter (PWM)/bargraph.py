@@ -0,0 +1,93 @@
+from micropython import const
+from machine import Pin, mem32
+from array import array
+import sys
+
+
+SIO_GPIO_OUT = const(0xD0000010)
+
+if('RP2350' in sys.implementation._machine):
+    SIO_GPIO_OUT_XOR = 0xD0000028
+else:
+    SIO_GPIO_OUT_XOR = 0xD000001C
+
+
+class bargraph():
+    def __init__(self, pins, active_low = False, dot = False, decay = 0, peak_hold = 0):
+        self.length = len(pins)
+        self.mask = 0
+        
+        for p in pins:
+            Pin(p, Pin.OUT)
+            self.mask |= (1 << p)
+            
+        if(active_low):
+            self.invert = self.mask
+        else:
+            self.invert = 0
+        
+        self.dots = array("I", [0 for _ in range(self.length + 1)])
+        self.bars = array("I", [0 for _ in range(self.length + 1)])
+        
+        for i in range(1, (self.length + 1)):
+            self.dots[i] = (1 << pins[(i - 1)])
+            self.bars[i] = (self.bars[(i - 1)] | self.dots[i])
+            
+        if(dot):
+            self.levels = self.dots
+        else:
+            self.levels = self.bars
+        
+        self.decay = decay
+        self.peak_hold = peak_hold
+        self.level = 0
+        self.peak = 0
+        self.peak_count = 0
+        
+        self.state = (mem32[SIO_GPIO_OUT] & self.mask)
+        self.write(self.invert)
+        
+        
+    def write(self, bits):
+        change = (bits ^ self.state)
+        
+        if(change):
+            mem32[SIO_GPIO_OUT_XOR] = change
+            self.state = bits
+            
+            
+    def show(self, value):
+        if(value < 0):
+            value = 0
+        elif(value > self.length):
+            value = self.length
+            
+        self.write(self.levels[value] ^ self.invert)
+        
+        
+    def update(self, value):
+        if(value < 0):
+            value = 0
+        elif(value > self.length):
+            value = self.length
+            
+        if((self.decay == 0) or ((value << 8) >= self.level)):
+            self.level = (value << 8)
+        else:
+            self.level = max((value << 8), (self.level - self.decay))
+            
+        bar = (self.level >> 8)
+        bits = self.levels[bar]
+        
+        if(self.peak_hold > 0):
+            if(bar >= self.peak):
+                self.peak = bar
+                self.peak_count = self.peak_hold
+            elif(self.peak_count > 0):
+                self.peak_count -= 1
+            else:
+                self.peak -= 1
+                
+            bits |= self.dots[self.peak]
+            
+        self.write(bits ^ self.invert)
@@ -1,18 +1,12 @@
 from machine import Pin, PWM, ADC
 from utime import sleep_ms, sleep_us
 import math
+from bargraph import bargraph
 
 
 adc = ADC(Pin(26))
 
-D0 = Pin(1, Pin.OUT)
-D1 = Pin(3, Pin.OUT)
-D2 = Pin(5, Pin.OUT)
-D3 = Pin(6, Pin.OUT)
-D4 = Pin(7, Pin.OUT)
-D5 = Pin(8, Pin.OUT)
-D6 = Pin(9, Pin.OUT)
-D7 = Pin(10, Pin.OUT)
+meter = bargraph((10, 9, 8, 7, 6, 5, 3, 1), active_low = True, decay = 64, peak_hold = 25)
 
 pwm1 = PWM(Pin(0))
 pwm1.freq(6000)
@@ -31,98 +25,6 @@ def map_value(v, x_min, x_max, y_min, y_max):
     return int(y_min + (((y_max - y_min)/(x_max - x_min)) * (v - x_min)))
 
 
-def level(value):
-    if(value == 8):
-        D0.low()
-        D1.low()
-        D2.low()
-        D3.low()
-        D4.low()
-        D5.low()
-        D6.low()
-        D7.low()
-    
-    elif(value == 7):
-        D0.high()
-        D1.low()
-        D2.low()
-        D3.low()
-        D4.low()
-        D5.low()
-        D6.low()
-        D7.low()
-        
-    elif(value == 6):
-        D0.high()
-        D1.high()
-        D2.low()
-        D3.low()
-        D4.low()
-        D5.low()
-        D6.low()
-        D7.low()
-        
-    elif(value == 5):
-        D0.high()
-        D1.high()
-        D2.high()
-        D3.low()
-        D4.low()
-        D5.low()
-        D6.low()
-        D7.low()
-        
-    elif(value == 4):
-        D0.high()
-        D1.high()
-        D2.high()
-        D3.high()
-        D4.low()
-        D5.low()
-        D6.low()
-        D7.low()
-        
-    elif(value == 3):
-        D0.high()
-        D1.high()
-        D2.high()
-        D3.high()
-        D4.high()
-        D5.low()
-        D6.low()
-        D7.low()
-        
-    elif(value == 2):
-        D0.high()
-        D1.high()
-        D2.high()
-        D3.high()
-        D4.high()
-        D5.high()
-        D6.low()
-        D7.low()
-        
-    elif(value == 1):
-        D0.high()
-        D1.high()
-        D2.high()
-        D3.high()
-        D4.high()
-        D5.high()
-        D6.high()
-        D7.low()
-        
-    else:
-        D0.high()
-        D1.high()
-        D2.high()
-        D3.high()
-        D4.high()
-        D5.high()
-        D6.high()
-        D7.high()
-        
-        
 def ADC_rms():
     rms = 0
     tmp = 0
@@ -168,7 +70,7 @@ while(True):
         pwm3.duty_u16(64000)
         
     i = map_value(db, 40, 90, 1, 8)
-    level(i)
+    meter.update(i)
     sleep_ms(40)
   
 
@@ -30,13 +30,17 @@ def constrain_value(v, max_v, min_v):
     return v
 
 
-def back_art(value):
+def back_art_static():
     tft.fill(tft.BLACK)
     tft.text("Raspberry Pi PICO RP2040 UPS" , 40, 20, tft.WHITE)
     
     tft.fill_rect(20, 50, 30, 10, tft.WHITE)
     tft.rect(10, 60, 50, 170, tft.WHITE)
     tft.rect(12, 62, 46, 166, tft.WHITE)
+
+
+def back_art(value):
+    tft.fill_rect(15, 65, 40, 160, tft.BLACK)
     
     h1 = map_value(value, 0, 100, 225, 65)
     h2 = map_value(value, 0, 100, 0, 160)
@@ -52,8 +56,15 @@ def back_art(value):
         colour = tft.GREEN
         
     tft.fill_rect(15, h1, 40, h2, colour)
+
+
+def text_field(s, y, colour):
+    tft.fill_rect(110, y, (tft.width - 110), 8, tft.BLACK)
+    tft.text(s, 110, y, colour)
     
     
+back_art_static()
+
 for i in range(0, 100, 5):
     back_art(i)
     tft.show()
@@ -98,10 +109,10 @@ while (True):
     back_art(c)
     
     tft.text("Battery Parameters" , 110, 55, tft.MAGENTA)
-    tft.text(("Voltage : " + str("%1.3f" %bv) + " V"), 110, 80, tft.CYAN)
-    tft.text(("Current : " + str("%4.1f" %i) + " mA"), 110, 110, tft.GREEN)
-    tft.text(("Power   : " + str("%3.2f" %p) + " W"), 110, 140, tft.RED)
-    tft.text(("Capacity: " + str("%3.1f" %c) + " %"), 110, 170, tft.YELLOW)
+    text_field(("Voltage : " + str("%1.3f" %bv) + " V"), 80, tft.CYAN)
+    text_field(("Current : " + str("%4.1f" %i) + " mA"), 110, tft.GREEN)
+    text_field(("Power   : " + str("%3.2f" %p) + " W"), 140, tft.RED)
+    text_field(("Capacity: " + str("%3.1f" %c) + " %"), 170, tft.YELLOW)
     
     tft.show()
     
@@ -8,6 +8,11 @@
 # D5 = base_pin + 1
 # D4 = base_pin + 0
 
+# Each TX FIFO word carries one byte for the LCD:
+# bit 0 = RS, bit 1 = high nibble only, bits 2-5 = high nibble,
+# bits 6-9 = low nibble, bits 10-31 = execution time to wait afterwards
+# in PIO cycles (1 us each)
+
 
 from machine import Pin
 from utime import sleep_ms
@@ -15,134 +20,174 @@ from rp2 import asm_pio, StateMachine, PIO
 from micropython import const
 
 
-clear_display = const(0x01)                
-goto_home = const(0x02)                                                    
-         
-cursor_direction_inc = const(0x06)    
+clear_display = const(0x01)
+goto_home = const(0x02)
+
+cursor_direction_inc = const(0x06)
 cursor_direction_dec = const(0x04)
-display_shift = const(0x05) 
+display_shift = const(0x05)
 display_no_shift = const(0x04)
 
 display_on = const(0x0C)
-display_off = const(0x0A)       
-cursor_on = const(0x0A)               
-cursor_off = const(0x08)       
-blink_on = const(0x09)   
-blink_off = const(0x08)         
-                                    
-_8_pin_interface = const(0x30)  
-_4_pin_interface = const(0x20)      
-_2_row_display = const(0x28) 
+display_off = const(0x0A)
+cursor_on = const(0x0A)
+cursor_off = const(0x08)
+blink_on = const(0x09)
+blink_off = const(0x08)
+
+_8_pin_interface = const(0x30)
+_4_pin_interface = const(0x20)
+_2_row_display = const(0x28)
 _1_row_display = const(0x20)
-_5x10_dots = const(0x60)                                                                                        
+_5x10_dots = const(0x60)
 _5x7_dots = const(0x20)
-                                   
+
 line_1_y_pos = const(0x00)
-line_2_y_pos = const(0x40) 
+line_2_y_pos = const(0x40)
 line_3_y_pos = const(0x14)
 line_4_y_pos = const(0x54)
 
-dly = const(2)
+lcd_columns = const(16)
+lcd_rows = const(2)
+
+power_on_dly = const(40)
+exec_dly = const(40)
+clear_dly = const(1600)
+init_dly = const(5000)
+nibble_dly = const(150)
 
 DAT = const(1)
 CMD = const(0)
+NIBBLE = const(2)
 
 
-lcd_value = 0
+line_pos = (line_1_y_pos, line_2_y_pos, line_3_y_pos, line_4_y_pos)
 
 
 class LCD():
-    
+
     @asm_pio(out_shiftdir = PIO.SHIFT_RIGHT,
-         autopull = True,
-         pull_thresh = 6,
-         out_init = ((PIO.OUT_HIGH, ) * 6))
-    
+         out_init = ((PIO.OUT_LOW, ) * 4),
+         set_init = PIO.OUT_LOW,
+         sideset_init = PIO.OUT_LOW,
+         fifo_join = PIO.JOIN_TX)
+
     def lcd_write():
-        pull(ifempty)  # Pull data from TX_FIFO if empty
-        out(pins, 6)   # write lcd info
-    
-    
-    def toggle_en(self):
-        global lcd_value
-        
-        lcd_value |= 0x10
-        sleep_ms(dly)
-        self.sm.put(lcd_value)
-        
-        lcd_value &= 0x2F
-        sleep_ms(dly)
-        self.sm.put(lcd_value)
-    
-    
-    def write(self, value, mode):
-        global lcd_value
-        
-        if(mode == DAT):
-            lcd_value |= 0x20
+        pull(block)            .side(0)      # wait for the next byte
+        out(x, 1)              .side(0)      # RS bit
+        jmp(not_x, 'command')  .side(0)
+        set(pins, 1)           .side(0)
+        jmp('nibbles')         .side(0)
+        label('command')
+        set(pins, 0)           .side(0)
+        label('nibbles')
+        out(x, 1)              .side(0)      # high nibble only
+        out(pins, 4)           .side(0) [1]  # high nibble, setup time
+        nop()                  .side(1) [1]  # EN high
+        nop()                  .side(0) [1]  # EN low, hold time
+        jmp(not_x, 'low')      .side(0)
+        out(null, 4)           .side(0)
+        jmp('wait')            .side(0)
+        label('low')
+        out(pins, 4)           .side(0) [1]  # low nibble, setup time
+        nop()                  .side(1) [1]  # EN high
+        nop()                  .side(0)      # EN low
+        label('wait')
+        out(y, 22)             .side(0)      # execution time
+        label('busy')
+        jmp(y_dec, 'busy')     .side(0)
+
+
+    def write(self, value, mode, delay = exec_dly):
+        self.sm.put(mode | ((value & 0xF0) >> 2) | ((value & 0x0F) << 6) | (delay << 10))
+
+
+    def write_nibble(self, value, delay):
+        self.sm.put(CMD | NIBBLE | ((value & 0x0F) << 2) | (delay << 10))
+
+
+    def set_address(self, x_pos, y_pos):
+        self.write((0x80 | (line_pos[y_pos & 0x03] + x_pos)), CMD)
+
+        if((x_pos < lcd_columns) and (y_pos < lcd_rows)):
+            self.address = ((y_pos * lcd_columns) + x_pos)
         else:
-            lcd_value &= 0x1F
-            
-        self.send(value)
-    
-    
-    def send(self, value):
-        global lcd_value
-        
-        temp = ((value & 0xF0) >> 4)
-        lcd_value &= 0x30
-        lcd_value |= (temp & 0x0F)
-        self.toggle_en()
-        
-        temp = (value & 0x0F)
-        lcd_value &= 0x30
-        lcd_value |= (temp & 0x0F)
-        self.toggle_en()
-        
-        
+            self.address = -1
+
+
     def clear_home(self):
-        self.write(clear_display, CMD)
-        self.write(goto_home, CMD)
-        
-        
+        self.write(clear_display, CMD, clear_dly)
+        self.write(goto_home, CMD, clear_dly)
+
+        for i in range(0, len(self.shadow)):
+            self.shadow[i] = 0x20
+
+        self.address = 0
+        self.x_pos = 0
+        self.y_pos = 0
+
+
     def goto_xy(self, x_pos, y_pos):
-        if(y_pos == 1):
-            self.write((0x80 | (line_2_y_pos + x_pos)), CMD)
-            
-        elif(y_pos == 2):
-            self.write((0x80 | (line_3_y_pos + x_pos)), CMD)
-            
-        elif(y_pos == 3):
-            self.write((0x80 | (line_4_y_pos + x_pos)), CMD)
-            
-        else:
-            self.write((0x80 | (line_1_y_pos + x_pos)), CMD)
-        
-        
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+
+
     def init(self):
-        sleep_ms(dly)
-        self.toggle_en()
-        self.write(0x33, CMD)
-        self.write(0x32, CMD)
-        
+        sleep_ms(power_on_dly)
+        self.write_nibble(0x03, init_dly)
+        self.write_nibble(0x03, nibble_dly)
+        self.write_nibble(0x03, nibble_dly)
+        self.write_nibble(0x02, nibble_dly)
+
         self.write((_4_pin_interface | _2_row_display | _5x7_dots), CMD)
         self.write((display_on | cursor_off | blink_off), CMD)
-        self.write(clear_display, CMD)
+        self.clear_home()
         self.write((cursor_direction_inc | display_no_shift), CMD)
-        
-        
+
+
     def put_chr(self, ch):
-        self.write(ord(ch), DAT)
-        
-        
+        value = ord(ch)
+
+        if((self.x_pos < lcd_columns) and (self.y_pos < lcd_rows)):
+            i = ((self.y_pos * lcd_columns) + self.x_pos)
+
+            if(self.shadow[i] != value):
+                if(self.address != i):
+                    self.set_address(self.x_pos, self.y_pos)
+
+                self.write(value, DAT)
+                self.shadow[i] = value
+
+                if((self.x_pos + 1) < lcd_columns):
+                    self.address = (i + 1)
+                else:
+                    self.address = -1
+        else:
+            self.set_address(self.x_pos, self.y_pos)
+            self.write(value, DAT)
+
+        self.x_pos += 1
+
+
     def put_str(self, ch_string):
         for chr in ch_string:
             self.put_chr(chr)
 
-        
+
+    def text(self, ch_string, x_pos, y_pos):
+        self.goto_xy(x_pos, y_pos)
+        self.put_str(ch_string)
+
+
     def __init__(self, base_pin):
+        self.shadow = bytearray(b" " * (lcd_columns * lcd_rows))
+        self.address = -1
+        self.x_pos = 0
+        self.y_pos = 0
+
         self.out_pin = Pin(base_pin, Pin.OUT)
-        self.sm = StateMachine(0, LCD.lcd_write, out_base = self.out_pin, freq = 250000)
+        self.set_pin = Pin((base_pin + 5), Pin.OUT)
+        self.en_pin = Pin((base_pin + 4), Pin.OUT)
+        self.sm = StateMachine(0, LCD.lcd_write, freq = 1000000, out_base = self.out_pin, set_base = self.set_pin, sideset_base = self.en_pin)
         self.sm.active(1)
         self.init()
-
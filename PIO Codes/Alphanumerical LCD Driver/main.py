@@ -1,5 +1,5 @@
 from machine import Pin
-from utime import sleep_ms, 
+from utime import sleep_ms
 from LCD_2x16 import LCD
 
 
@@ -10,13 +10,11 @@ lcd = LCD(0)
 
 
 lcd.clear_home()
-lcd.goto_xy(1, 0)
-lcd.put_str("RP2040 PIO LCD")
+lcd.text("RP2040 PIO LCD", 1, 0)
 
 
 while(True):
-    lcd.goto_xy(6, 1)
-    lcd.put_str(str("%2.1f " % i))
+    lcd.text(str("%2.1f " % i), 6, 1)
     i += 0.1
     sleep_ms(100)
     
@@ -2,6 +2,7 @@ from machine import Pin
 from time import sleep_ms, ticks_us
 from rp2 import asm_pio, StateMachine, PIO
 from ST7789 import TFT114
+from text_renderer import text_renderer
 
 t1 = 0
 t2 = 0
@@ -25,6 +26,7 @@ def irq_0_handler(sm):
     
 sense_pin = Pin(0, Pin.IN)
 tft = TFT114()
+txt = text_renderer()
     
 sm = StateMachine(0, IO_ops, in_base = sense_pin)
 sm.irq(irq_0_handler)
@@ -32,19 +34,7 @@ sm.active(1)
 
 
 def write_text(text, x, y, size, color):
-        background = tft.pixel(x, y)
-        info = []
-        
-        tft.text(text, x, y, color)
-        for i in range(x, x + (8 * len(text))):
-            for j in range(y, y + 8):
-                px_color = tft.pixel(i, j)
-                info.append((i, j, px_color)) if px_color == color else None
-        
-        tft.text(text, x, y, background)
-       
-        for px_info in info:
-            tft.fill_rect(size*px_info[0] - (size-1)*x , size*px_info[1] - (size-1)*y, size, size, px_info[2]) 
+        txt.text(tft, text, x, y, color, size)
 
 
 while(True):
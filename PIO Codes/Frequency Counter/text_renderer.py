@@ -0,0 +1,68 @@
+from micropython import const
+from ucollections import OrderedDict
+import framebuf
+
+
+GLYPH_SIZE = const(8)
+
+
+class text_renderer():
+    def __init__(self, budget = 4096, format = framebuf.RGB565):
+        self.budget = budget
+        self.used = 0
+        self.cache = OrderedDict()
+        
+        self.source = framebuf.FrameBuffer(bytearray(GLYPH_SIZE), GLYPH_SIZE, GLYPH_SIZE, framebuf.MONO_HLSB)
+        self.palette = framebuf.FrameBuffer(bytearray(4), 2, 1, format)
+        
+        
+    def build(self, ch, size):
+        w = (GLYPH_SIZE * size)
+        length = (((w + 7) >> 3) * w)
+        glyph = framebuf.FrameBuffer(bytearray(length), w, w, framebuf.MONO_HLSB)
+        
+        self.source.fill(0)
+        self.source.text(ch, 0, 0, 1)
+        
+        for y in range(GLYPH_SIZE):
+            for x in range(GLYPH_SIZE):
+                if(self.source.pixel(x, y)):
+                    glyph.fill_rect((x * size), (y * size), size, size, 1)
+                    
+        return (glyph, length)
+    
+    
+    def glyph(self, ch, size):
+        key = (ch, size)
+        entry = self.cache.pop(key, None)
+        
+        if(entry == None):
+            entry = self.build(ch, size)
+            self.used += entry[1]
+            
+            while((self.used > self.budget) and (len(self.cache) > 0)):
+                self.used -= self.cache.pop(next(iter(self.cache)))[1]
+                
+        self.cache[key] = entry
+        return entry[0]
+    
+    
+    def text(self, target, s, x, y, colour, size = 1, background = None):
+        if((size == 1) and (background == None)):
+            target.text(s, x, y, colour)
+            return
+        
+        self.palette.pixel(1, 0, colour)
+        
+        if(background == None):
+            self.palette.pixel(0, 0, (colour ^ 0xFFFF))
+            key = self.palette.pixel(0, 0)
+        else:
+            self.palette.pixel(0, 0, background)
+            key = -1
+            
+        w = (GLYPH_SIZE * size)
+        
+        for ch in s:
+            target.blit(self.glyph(ch, size), x, y, key, self.palette)
+            x += w
@@ -0,0 +1,139 @@
+from micropython import const
+from machine import Pin
+from utime import ticks_us, ticks_diff, sleep_us
+from rp2 import asm_pio, StateMachine, PIO, DMA
+import micropython
+
+
+# Up to 8 strips on consecutive GPIOs (base_pin + strip number).
+# Each strip's pixels are kept as GRB bytes. Before a frame is sent, the
+# bytes are transposed into bit-planes: plane byte n carries bit n of every
+# strip, MSB first, so one PIO "mov pins" drives all strips per bit slot.
+
+max_strips = const(8)
+bit_time_us_x100 = const(125)
+reset_time_us = const(300)
+
+DREQ_PIO0_TX0 = const(0)
+
+
+def ws2812_parallel():
+    wrap_target()
+    out(x, 8)
+    mov(pins, invert(null))    [2]
+    mov(pins, x)               [2]
+    mov(pins, null)            [2]
+    wrap()
+
+
+@micropython.viper
+def transpose_planes(dst, src, strips: int, length: int):
+    d = ptr8(dst)
+    s = ptr8(src)
+    i = 0
+    k = 0
+    
+    while(i < length):
+        x = 0
+        y = 0
+        j = 0
+        offset = i
+        
+        while(j < strips):
+            if(j < 4):
+                y |= (int(s[offset]) << (j << 3))
+            else:
+                x |= (int(s[offset]) << ((j - 4) << 3))
+                
+            offset += length
+            j += 1
+            
+        t = ((x ^ (x >> 7)) & 0x00AA00AA)
+        x = (x ^ t ^ (t << 7))
+        t = ((y ^ (y >> 7)) & 0x00AA00AA)
+        y = (y ^ t ^ (t << 7))
+        t = ((x ^ (x >> 14)) & 0x0000CCCC)
+        x = (x ^ t ^ (t << 14))
+        t = ((y ^ (y >> 14)) & 0x0000CCCC)
+        y = (y ^ t ^ (t << 14))
+        t = ((((x >> 4) & 0x0F0F0F0F) << 4) | ((y >> 4) & 0x0F0F0F0F))
+        y = (((x & 0x0F0F0F0F) << 4) | (y & 0x0F0F0F0F))
+        x = t
+        
+        d[k] = (x >> 24)
+        d[(k + 1)] = (x >> 16)
+        d[(k + 2)] = (x >> 8)
+        d[(k + 3)] = x
+        d[(k + 4)] = (y >> 24)
+        d[(k + 5)] = (y >> 16)
+        d[(k + 6)] = (y >> 8)
+        d[(k + 7)] = y
+        
+        k += 8
+        i += 1
+
+
+class WS2812_Parallel():
+    def __init__(self, base_pin, strips, leds_per_strip, sm_id = 0, handler = None):
+        if((strips < 1) or (strips > max_strips)):
+            raise ValueError("1 to 8 strips are supported")
+        
+        self.strips = strips
+        self.leds = leds_per_strip
+        self.length = (leds_per_strip * 3)
+        
+        self.pixels = bytearray(self.length * strips)
+        self.planes = bytearray(self.length * 8)
+        self.frame_us = (((self.length * 8 * bit_time_us_x100) // 100) + reset_time_us)
+        self.started = ticks_us()
+        
+        program = asm_pio(out_init = ((PIO.OUT_LOW, ) * strips),
+                          out_shiftdir = PIO.SHIFT_RIGHT,
+                          autopull = True,
+                          pull_thresh = 32)(ws2812_parallel)
+        
+        self.sm = StateMachine(sm_id, program, freq = 8000000, out_base = Pin(base_pin))
+        self.sm.active(1)
+        
+        self.dma = DMA()
+        self.dma_ctrl = self.dma.pack_ctrl(size = 2, inc_write = False, treq_sel = (DREQ_PIO0_TX0 + ((sm_id >> 2) * 8) + (sm_id & 0x03)), irq_quiet = (handler is None))
+        
+        if(handler is not None):
+            self.dma.irq(handler)
+            
+            
+    def strip_buffer(self, strip):
+        return memoryview(self.pixels)[(strip * self.length):((strip + 1) * self.length)]
+    
+    
+    def set_pixel(self, strip, i, colour):
+        i = ((strip * self.length) + (i * 3))
+        self.pixels[i] = colour[1]
+        self.pixels[(i + 1)] = colour[0]
+        self.pixels[(i + 2)] = colour[2]
+        
+        
+    def fill(self, colour):
+        for i in range(0, len(self.pixels), 3):
+            self.pixels[i] = colour[1]
+            self.pixels[(i + 1)] = colour[0]
+            self.pixels[(i + 2)] = colour[2]
+            
+            
+    def busy(self):
+        return self.dma.active()
+    
+    
+    def show(self):
+        wait = (self.frame_us - ticks_diff(ticks_us(), self.started))
+        
+        if(wait > 0):
+            sleep_us(wait)
+            
+        while(self.dma.active()):
+            pass
+        
+        transpose_planes(self.planes, self.pixels, self.strips, self.length)
+        
+        self.started = ticks_us()
+        self.dma.config(read = self.planes, write = self.sm, count = (len(self.planes) >> 2), ctrl = self.dma_ctrl, trigger = True)
@@ -0,0 +1,23 @@
+from WS2812_Parallel import WS2812_Parallel
+from utime import sleep_ms
+
+
+no_of_strips = 4
+no_of_LEDs = 64
+
+colours = [(15, 0, 0), (0, 15, 0), (0, 0, 15), (15, 15, 0)]
+
+ws = WS2812_Parallel(6, no_of_strips, no_of_LEDs)
+
+
+pos = 0
+
+while(True):
+    ws.fill((0, 0, 0))
+    
+    for i in range(0, no_of_strips):
+        ws.set_pixel(i, ((pos + (i * 4)) % no_of_LEDs), colours[i])
+        
+    ws.show()
+    pos = ((pos + 1) % no_of_LEDs)
+    sleep_ms(20)
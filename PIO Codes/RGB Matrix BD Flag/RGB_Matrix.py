@@ -1,6 +1,9 @@
 from micropython import const
 from machine import Pin
-from rp2 import asm_pio, StateMachine, PIO
+from utime import ticks_us, ticks_diff, sleep_us
+import framebuf
+from rp2 import asm_pio, StateMachine, PIO, DMA
+import micropython
 import array
 
 
@@ -11,6 +14,12 @@ colour_depth = const(8)
 Total_Bits = (channels * colour_depth)
 LEDs = (col * row)
 
+bit_time_us_x100 = const(125)
+reset_time_us = const(300)
+
+sm_id = const(0)
+DREQ_PIO0_TX0 = const(0)
+
 
 font = [
         [0x00, 0x00, 0x00],                        # Code for char
@@ -112,6 +121,70 @@ font = [
     ]
 
 
+@micropython.viper
+def scale_pixels(dst, src, lut, n: int):
+    d = ptr32(dst)
+    s = ptr32(src)
+    l = ptr8(lut)
+    i = 0
+    
+    while(i < n):
+        c = int(s[i])
+        d[i] = ((l[((c >> 8) & 0xFF)] << 24) | (l[((c >> 16) & 0xFF)] << 16) | (l[(c & 0xFF)] << 8))
+        i += 1
+
+
+@micropython.viper
+def pack_pixels(dst, src, index_map, palette, n: int):
+    d = ptr32(dst)
+    s = ptr8(src)
+    m = ptr16(index_map)
+    p = ptr32(palette)
+    i = 0
+    
+    while(i < n):
+        d[i] = p[s[m[i]]]
+        i += 1
+
+
+def panel_map(width, height, panel_width, panel_height, serpentine = False, rotation = 0):
+    index_map = array.array("H", [0 for _ in range(width * height)])
+    panels_across = (width // panel_width)
+    panel_leds = (panel_width * panel_height)
+    
+    if((rotation == 90) or (rotation == 270)):
+        led_columns = panel_height
+    else:
+        led_columns = panel_width
+    
+    for i in range(0, len(index_map)):
+        panel = (i // panel_leds)
+        lx = ((i % panel_leds) % led_columns)
+        ly = ((i % panel_leds) // led_columns)
+        
+        if(serpentine and (ly & 0x01)):
+            lx = (led_columns - 1 - lx)
+            
+        if(rotation == 90):
+            px = (panel_width - 1 - ly)
+            py = lx
+        elif(rotation == 180):
+            px = (panel_width - 1 - lx)
+            py = (panel_height - 1 - ly)
+        elif(rotation == 270):
+            px = ly
+            py = (panel_height - 1 - lx)
+        else:
+            px = lx
+            py = ly
+            
+        x_pos = (((panel % panels_across) * panel_width) + px)
+        y_pos = (((panel // panels_across) * panel_height) + py)
+        index_map[i] = ((y_pos * width) + x_pos)
+        
+    return index_map
+
+
 class RGB_Matrix():
     
     @asm_pio(sideset_init = PIO.OUT_LOW,
@@ -130,9 +203,11 @@ class RGB_Matrix():
         wrap()
         
         
-    def __init__(self, _pin, no_of_LEDs = LEDs):
+    def __init__(self, _pin, width = col, height = row, index_map = None, handler = None):
         self.pin = _pin
-        self.leds = no_of_LEDs
+        self.width = width
+        self.height = height
+        self.leds = (width * height)
         
         self.NO = False
         self.YES = True
@@ -152,88 +227,121 @@ class RGB_Matrix():
         self.PURPLE = (15, 0, 15)
         self.WHITE = (15, 15, 15)
         
-        self.disp_array = array.array("I", [0 for _ in range(self.leds)])
+        self.buffer = bytearray(self.leds)
+        self.fb = framebuf.FrameBuffer(self.buffer, width, height, framebuf.GS8)
+        
+        if(index_map is None):
+            index_map = array.array("H", [i for i in range(self.leds)])
+            
+        self.index_map = index_map
+        
+        self.palette = array.array("I", [0 for _ in range(256)])
+        self.scaled_palette = array.array("I", [0 for _ in range(256)])
+        self.colour_map = {self.BLACK: 0}
+        self.free = [i for i in range(255, 0, -1)]
+        self.palette_changed = True
+        
+        self.show_arrays = (array.array("I", [0 for _ in range(self.leds)]), array.array("I", [0 for _ in range(self.leds)]))
+        self.back = 0
+        self.frame_us = (((self.leds * Total_Bits * bit_time_us_x100) // 100) + reset_time_us)
+        self.started = ticks_us()
+        self.lut = bytearray(256)
+        self.brightness = -1
        
-        self.sm = StateMachine(0, RGB_Matrix.WS281x, freq = 8000000, sideset_base = Pin(self.pin))
+        self.sm = StateMachine(sm_id, RGB_Matrix.WS281x, freq = 8000000, sideset_base = Pin(self.pin))
         self.sm.active(1)
         
+        self.dma = DMA()
+        self.dma_ctrl = self.dma.pack_ctrl(size = 2, inc_write = False, treq_sel = (DREQ_PIO0_TX0 + sm_id), irq_quiet = (handler is None))
+        
+        if(handler is not None):
+            self.dma.irq(handler)
+            
+            
+    def collect_colours(self):
+        used = bytearray(256)
+        
+        for i in self.buffer:
+            used[i] = 1
+            
+        for colour in list(self.colour_map):
+            i = self.colour_map[colour]
+            
+            if((i != 0) and (used[i] == 0)):
+                del self.colour_map[colour]
+                self.free.append(i)
+        
     
-    def pixels_show(self, brightness):
-        display_array = array.array("I", [0 for _ in range(self.leds)])
+    def colour_index(self, colour):
+        i = self.colour_map.get(colour)
         
-        brightness = (brightness / 100)
+        if(i is None):
+            if(len(self.free) == 0):
+                self.collect_colours()
+                
+                if(len(self.free) == 0):
+                    raise ValueError("Too many colours on the matrix")
+                
+            i = self.free.pop()
+            self.colour_map[colour] = i
+            self.palette[i] = ((colour[1] << 16) + (colour[0] << 8) + colour[2])
+            self.palette_changed = True
+            
+        return i
         
-        for i, c in enumerate(self.disp_array):
+    
+    def set_brightness(self, brightness):
+        if(brightness != self.brightness):
+            for i in range(0, 256):
+                self.lut[i] = min(255, int((i * brightness) / 100))
+                
+            self.brightness = brightness
+            self.palette_changed = True
             
-            r = int(((c >> 8) & 0xFF) * brightness)
-            g = int(((c >> 16) & 0xFF) * brightness)
-            b = int((c & 0xFF) * brightness)
             
-            display_array[i] = ((r << 16) + (g << 8) + b)
+    def busy(self):
+        return self.dma.active()
+    
+    
+    def show(self):
+        wait = (self.frame_us - ticks_diff(ticks_us(), self.started))
+        
+        if(wait > 0):
+            sleep_us(wait)
+            
+        while(self.dma.active()):
+            pass
+        
+        self.started = ticks_us()
+        self.dma.config(read = self.show_arrays[self.back], write = self.sm, count = self.leds, ctrl = self.dma_ctrl, trigger = True)
+        self.back ^= 1
             
-        self.sm.put(display_array, 8)
+    
+    def pixels_show(self, brightness):
+        self.set_brightness(brightness)
+        
+        if(self.palette_changed):
+            scale_pixels(self.scaled_palette, self.palette, self.lut, 256)
+            self.palette_changed = False
+            
+        pack_pixels(self.show_arrays[self.back], self.buffer, self.index_map, self.scaled_palette, self.leds)
+        self.show()
         
 
     def pixels_set(self, i, colour):
-        self.disp_array[i] = ((colour[1] << 16) + (colour[0] << 8) + colour[2])
+        self.buffer[i] = self.colour_index(colour)
         
         
     def draw_pixel(self, x_pos, y_pos, colour):
-        temp = ((y_pos << 4) + x_pos)
-        self.pixels_set(temp, colour)
+        self.fb.pixel(x_pos, y_pos, self.colour_index(colour))
 
 
     def pixels_fill(self, colour):
-        for i in range(len(self.disp_array)):
-            self.pixels_set(i, colour)
+        self.fb.fill(self.colour_index(colour))
             
             
     def draw_line(self, x1, y1, x2, y2, colour):
-        dx = (x2 - x1)
-        dy = (y2 - y1)
-        
-        if(dy < 0):
-            dy = -dy
-            step_y = -1
-            
-        else:
-            step_y = 1
-            
-        if(dx < 0):
-            dx = -dx
-            step_x = -1
-            
-        else:
-            step_x = 1
-            
-        dx <<= 1
-        dy <<= 1
-        
-        self.draw_pixel(x1, y1, colour)
-        
-        if(dx > dy):
-            fraction = (dy - (dx >> 1))
-            while(x1 != x2):
-                if(fraction >= 0):
-                    y1 += step_y
-                    fraction -= dx
-                
-                x1 += step_x
-                fraction += dy
-                
-                self.draw_pixel(x1, y1, colour)
-                
-        else:
-            fraction = (dx - (dy >> 1))
-            while(y1 != y2):
-                if(fraction >= 0):
-                    x1 += step_x
-                    fraction -= dy
-                
-                y1 += step_y
-                fraction += dx
-                
-                self.draw_pixel(x1, y1, colour)
+        self.fb.line(x1, y1, x2, y2, self.colour_index(colour))
                 
     
     def draw_V_line(self, x1, y1, y2, colour):
@@ -245,121 +353,12 @@ class RGB_Matrix():
         
         
     def draw_circle(self, xc, yc, r, f, colour):
-       a = 0
-       b = r
-       p = (1 - b)
-       
-       while(a <= b):
-           if(f == self.YES):
-               self.draw_line((xc - a), (yc + b), (xc + a), (yc + b), colour)
-               self.draw_line((xc - a), (yc - b), (xc + a), (yc - b), colour)
-               self.draw_line((xc - b), (yc + a), (xc + b), (yc + a), colour)
-               self.draw_line((xc - b), (yc - a), (xc + b), (yc - a), colour)
-               
-           else:
-               self.draw_pixel((xc + a), (yc + b), colour)
-               self.draw_pixel((xc + b), (yc + a), colour)
-               self.draw_pixel((xc - a), (yc + b), colour)
-               self.draw_pixel((xc - b), (yc + a), colour)
-               self.draw_pixel((xc + b), (yc - a), colour)
-               self.draw_pixel((xc + a), (yc - b), colour)
-               self.draw_pixel((xc - a), (yc - b), colour)
-               self.draw_pixel((xc - b), (yc - a), colour)
-            
-           if(p < 0):
-               p += (3 + (2 * a))
-               a += 1
-            
-           else:
-               p += (5 + (2 * (a  - b)))
-               a += 1
-               b -= 1
+        self.fb.ellipse(xc, yc, r, r, self.colour_index(colour), (f == self.YES))
+        
                
     def draw_triangle(self, x1, y1, x2, y2, x3, y3, f, colour):
-        a = 0
-        b = 0
-        l = 0
-        sa = 0
-        sb = 0
-        yp = 0
-        dx12 = 0
-        dx23 = 0
-        dx13 = 0
-        dy12 = 0
-        dy23 = 0
-        dy13 = 0
-        
         if(f == self.YES):
-            if(y1 > y2):
-                y1, y2 = y2, y1
-                x1, x2 = x2, x1
-                
-            if(y2 > y3):
-                y2, y3 = y3, y2
-                x2, x3 = x3, x2
-                
-            if(y3 > y1):
-                y1, y3 = y3, y1
-                x1, x3 = x3, x1
-                
-            if(y1 == y3):
-                a = x1
-                b = a
-                
-                if(x2 < a):
-                    a = x2
-                
-                elif(x2 > b):
-                    b = x2
-                    
-                if(x3 < a):
-                    a = x3
-                
-                elif(x3 > b):
-                    b = x3
-                
-                self.draw_H_line(a, (a + (b - (a + 1))), y1, colour)
-                return
-            
-            dx12 = (x2 - x1)
-            dy12 = (y2 - y1)
-            dx13 = (x3 - x1)
-            dy13 = (y3 - y1)
-            dx23 = (x3 - x2)
-            dy23 = (y3 - y2)
-            
-            if(y2 == y3):
-                l = (y2 + 1)
-            
-            else:
-                l = y2
-            
-            for yp in range(y1, l):
-                a = int(float(x1)+ float(sa / dy12))
-                b = int(float(x1) + float(sb / dy13))
-                
-                sa += dx12
-                sb += dx13
-                
-                if(a > b):
-                    a, b = b, a
-                
-                self.draw_H_line(a, (a + (b - (a + 1))), yp, colour)
-            
-            sa = int(float(dx23) * float(yp - y2))
-            sb = int(float(dx13) * float(yp - y1))
-
-            while(yp <= y3):
-                a = int(float(x2) + float(sa / dy23))
-                b = int(float(x1) + float(sb / dy13))
-                sa += dx23
-                sb += dx13
-
-                if(a > b):
-                    a, b = b, a
-                    
-                self.draw_H_line(a, (a + (b - (a + 1))), yp, colour)
-                yp += 1
+            self.fb.poly(0, 0, array.array("h", [x1, y1, x2, y2, x3, y3]), self.colour_index(colour), True)
             
         else:
             self.draw_line(x1, y1, x2, y2, colour)
@@ -367,37 +366,11 @@ class RGB_Matrix():
             self.draw_line(x1, y1, x3, y3, colour)
             
     
-    def draw_rectangle(self, x1, y1, x2, y2, f, type, colour, back_colour):       
-        if(f == self.YES):
-            
-            if(x1 < x2):
-                xmin = x1
-                xmax = x2
-            
-            else:
-                xmin = x2
-                xmax = x1
-                
-            if(y1 < y2):
-                ymin = y1
-                ymax = y2
-            
-            else:
-                ymin = y2
-                ymax = y1
-                
-            while(xmin <= xmax):
-                i = ymin
-                while(i <= ymax):
-                    self.draw_pixel(xmin, i, colour)
-                    i += 1
-                xmin += 1
-                
-        else:
-            self.draw_V_line(x1, y1, y2, colour)
-            self.draw_V_line(x2, y1, y2, colour)
-            self.draw_H_line(x1, x2, y1, colour)
-            self.draw_H_line(x1, x2, y2, colour)
+    def draw_rectangle(self, x1, y1, x2, y2, f, type, colour, back_colour):
+        xmin = min(x1, x2)
+        ymin = min(y1, y2)
+        
+        self.fb.rect(xmin, ymin, (abs(x2 - x1) + 1), (abs(y2 - y1) + 1), self.colour_index(colour), (f == self.YES))
     
         if(type == self.ROUNDED):
             self.draw_pixel(x1, y1, back_colour)
@@ -408,14 +381,16 @@ class RGB_Matrix():
             
     def draw_font(self, x_pos, y_pos, ch, colour, back_colour):        
         v = (ord(ch) - 0x20)
+        fg = self.colour_index(colour)
+        bg = self.colour_index(back_colour)
         
         for i in range (0, 3):
             temp = font[v][i]
             for j in range (5, 0, -1):
                 if(temp & 0x10):
-                   self.draw_pixel((x_pos + i), (y_pos + j), colour)
+                    self.fb.pixel((x_pos + i), (y_pos + j), fg)
                 else:
-                    self.draw_pixel((x_pos + i), (y_pos + j), back_colour)
+                    self.fb.pixel((x_pos + i), (y_pos + j), bg)
                 
                 temp <<= 1
     
@@ -423,5 +398,8 @@ class RGB_Matrix():
     def print_str(self, x_pos, y_pos, ch_str, colour, back_colour):
         for chr in ch_str:
             self.draw_font(x_pos, y_pos, chr, colour, back_colour)
-            x_pos += 4              
-                
+            x_pos += 4
+            
+            
+    def text(self, ch_str, x_pos, y_pos, colour):
+        self.fb.text(ch_str, x_pos, y_pos, self.colour_index(colour))
@@ -0,0 +1,99 @@
+# Host-side converter: python rle_convert.py <image file or Python image module> <output.rle>
+#
+# Output layout: b"RLE1", width (u16 LE), height (u16 LE), then the bitmap in
+# row-major order as alternating runs of clear and set pixels, starting with a
+# clear run. Each run is a byte count; runs of 255 or more are written as 0xFF
+# bytes followed by the remainder. A trailing clear run is left out.
+#
+# A Python image module defines image_width, image_height, image_data and
+# optionally image_format ("MONO_VLSB", "MONO_HLSB" or "MONO_HMSB").
+
+import struct
+import sys
+
+
+def load_module(path):
+    values = {}
+    
+    with open(path) as f:
+        exec(f.read(), {"bytearray": bytes}, values)
+        
+    width = values["image_width"]
+    height = values["image_height"]
+    data = bytes(values["image_data"])
+    fmt = values.get("image_format", "MONO_VLSB")
+    pixels = []
+    
+    for y in range(0, height):
+        for x in range(0, width):
+            if(fmt == "MONO_VLSB"):
+                bit = (data[((y >> 3) * width) + x] >> (y & 0x07))
+            elif(fmt == "MONO_HLSB"):
+                bit = (data[(y * ((width + 7) >> 3)) + (x >> 3)] >> (7 - (x & 0x07)))
+            else:
+                bit = (data[(y * ((width + 7) >> 3)) + (x >> 3)] >> (x & 0x07))
+                
+            pixels.append(bit & 0x01)
+            
+    return width, height, pixels
+
+
+def load_image(path):
+    from PIL import Image
+    
+    image = Image.open(path).convert("1")
+    pixels = [(1 if p else 0) for p in image.getdata()]
+        
+    return image.width, image.height, pixels
+
+
+def encode(pixels):
+    runs = []
+    value = 0
+    count = 0
+    
+    for p in pixels:
+        if(p == value):
+            count += 1
+        else:
+            runs.append(count)
+            value = p
+            count = 1
+            
+    if(value == 1):
+        runs.append(count)
+        
+    data = bytearray()
+    for run in runs:
+        while(run >= 255):
+            data.append(255)
+            run -= 255
+            
+        data.append(run)
+        
+    return bytes(data)
+
+
+def main():
+    if(len(sys.argv) != 3):
+        print("usage: rle_convert.py <input .py/.png/.jpg/.bmp> <output.rle>")
+        sys.exit(1)
+        
+    source, target = sys.argv[1], sys.argv[2]
+    
+    if(source.endswith(".py")):
+        width, height, pixels = load_module(source)
+    else:
+        width, height, pixels = load_image(source)
+        
+    data = encode(pixels)
+        
+    with open(target, "wb") as f:
+        f.write(b"RLE1" + struct.pack("<HH", width, height))
+        f.write(data)
+        
+    print("%s: %u x %u, %u bytes (%u raw)" % (target, width, height, (len(data) + 8), ((width * height) // 8)))
+
+
+if __name__ == "__main__":
+    main()
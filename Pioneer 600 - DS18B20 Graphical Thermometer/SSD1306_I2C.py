@@ -1,4 +1,5 @@
 from micropython import const
+import micropython
 from machine import Pin, SPI
 from utime import sleep_ms
 import framebuf  
@@ -44,6 +45,36 @@ SSD1306_LEFT_HORIZONTAL_SCROLL               = const(0x27)
 SSD1306_VERTICAL_AND_RIGHT_HORIZONTAL_SCROLL = const(0x29)
 SSD1306_VERTICAL_AND_LEFT_HORIZONTAL_SCROLL  = const(0x2A)
 
+# Unchanged columns tolerated inside one run before it is split in two
+SSD1306_RUN_GAP                              = const(6)
+
+
+@micropython.viper
+def first_change(new: ptr8, old: ptr8, start: int, end: int) -> int:
+    i = start
+    while(i < end):
+        if(new[i] != old[i]):
+            return i
+        i += 1
+
+    return end
+
+
+@micropython.viper
+def run_end(new: ptr8, old: ptr8, start: int, end: int, gap: int) -> int:
+    i = start
+    last = start
+    while(i < end):
+        if(new[i] != old[i]):
+            last = i
+
+        elif((i - last) > gap):
+            break
+
+        i += 1
+
+    return (last + 1)
+
 
 class OLED1306(framebuf.FrameBuffer):
 
@@ -60,8 +91,12 @@ class OLED1306(framebuf.FrameBuffer):
 
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]   
+        self.window = bytearray([0x00, SSD1306_COLUMN_ADDR, 0x00, 0x00, SSD1306_PAGE_ADDR, 0x00, 0x00])
         
         self.buffer = bytearray(self._pages * self.width)
+        self.buffer_view = memoryview(self.buffer)
+        self.shadow = bytearray(len(self.buffer))
+        self.shadow_valid = False
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
@@ -113,20 +148,42 @@ class OLED1306(framebuf.FrameBuffer):
         self.write_command(SSD1306_DISPLAY_ALL_ON_RESUME)
         self.write_command(SSD1306_NORMAL_DISPLAY)
         self.write_command(SSD1306_DISPLAY_ON)
+        self.shadow_valid = False
+
+
+    def set_window(self, x0, page0, x1, page1):
+        self.window[2] = x0
+        self.window[3] = x1
+        self.window[5] = page0
+        self.window[6] = page1
+        self.i2c.writeto(self.i2c_addr, self.window)
+
+
+    def invalidate(self):
+        self.shadow_valid = False
 
 
     def show(self):
         x0 = 0
-        x1 = (self.width - 1)
         if (self.width == 64):
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
-            x1 += 32
-            
-        self.write_command(SSD1306_COLUMN_ADDR)
-        self.write_command(x0)
-        self.write_command(x1)
-        self.write_command(SSD1306_PAGE_ADDR)
-        self.write_command(0x00)
-        self.write_command((self._pages - 1))
-        self.write_data(self.buffer)
+
+        if(self.shadow_valid == False):
+            self.set_window(x0, 0x00, (x0 + self.width - 1), (self._pages - 1))
+            self.write_data(self.buffer)
+            self.shadow[:] = self.buffer
+            self.shadow_valid = True
+            return
+
+        for page in range(0, self._pages):
+            s = (page * self.width)
+            e = (s + self.width)
+            x = first_change(self.buffer, self.shadow, s, e)
+
+            while(x < e):
+                x_end = run_end(self.buffer, self.shadow, x, e, SSD1306_RUN_GAP)
+                self.set_window((x0 + x - s), page, (x0 + x_end - s - 1), page)
+                self.write_data(self.buffer_view[x:x_end])
+                self.shadow[x:x_end] = self.buffer_view[x:x_end]
+                x = first_change(self.buffer, self.shadow, x_end, e)
@@ -0,0 +1,64 @@
+from micropython import const
+from struct import unpack
+
+
+RLE_IMAGE_MAGIC = b"RLE1"
+RLE_IMAGE_HEADER_SIZE = const(8)
+
+
+class rle_image():
+    def __init__(self, source):
+        if(isinstance(source, str)):
+            with open(source, "rb") as f:
+                source = f.read()
+        
+        if(source[0:4] != RLE_IMAGE_MAGIC):
+            raise ValueError("Invalid RLE image data!")
+        
+        self.data = source
+        self.width, self.height = unpack("<HH", source[4:8])
+        
+        
+    def span(self, fb, x, y, pos, run, colour):
+        row = (pos // self.width)
+        col = (pos - (row * self.width))
+        
+        if(col > 0):
+            length = min(run, (self.width - col))
+            fb.hline((x + col), (y + row), length, colour)
+            run -= length
+            row += 1
+            
+        if(run >= self.width):
+            rows = (run // self.width)
+            fb.fill_rect(x, (y + row), self.width, rows, colour)
+            run -= (rows * self.width)
+            row += rows
+            
+        if(run > 0):
+            fb.hline(x, (y + row), run, colour)
+            
+            
+    def draw(self, fb, x, y, colour = 1, background = None):
+        if(background != None):
+            fb.fill_rect(x, y, self.width, self.height, background)
+        
+        data = self.data
+        i = RLE_IMAGE_HEADER_SIZE
+        pos = 0
+        value = 0
+        
+        while(i < len(data)):
+            run = 0
+            while(True):
+                b = data[i]
+                i += 1
+                run += b
+                if(b != 0xFF):
+                    break
+                
+            if(value):
+                self.span(fb, x, y, pos, run, colour)
+                
+            pos += run
+            value ^= 1
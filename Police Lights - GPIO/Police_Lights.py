@@ -1,5 +1,6 @@
 import machine
 import utime
+from timeline import timeline, player
 
 i = 0
 state = 0
@@ -10,62 +11,58 @@ LED_BLUE = machine.Pin(5, machine.Pin.OUT)
 button = machine.Pin(2, machine.Pin.IN)
 
 
+def pattern(steps, period):
+    tl = timeline()
+    red = tl.channel(LED_RED.value)
+    blue = tl.channel(LED_BLUE.value)
+    
+    for t, r, b in steps:
+        tl.add(t, red, r)
+        tl.add(t, blue, b)
+        
+    tl.compile(period)
+    return tl
+
+
+flash = []
+
+for i in range(0, 3, 1):
+    flash.append(((i * 80), 1, 0))
+    flash.append((((i * 80) + 40), 0, 0))
+    flash.append(((240 + (i * 80)), 0, 1))
+    flash.append(((280 + (i * 80)), 0, 0))
+
+
+patterns = [
+    pattern([(0, 0, 0)], 1000),
+    pattern([(0, 1, 0), (200, 0, 1)], 400),
+    pattern([(0, 1, 1), (200, 0, 0)], 400),
+    pattern(flash, 480),
+    pattern([(0, 1, 1), (60, 0, 0)], 370)
+]
+
+lights = player()
+
+for p in patterns:
+    lights.add(p)
+    
+patterns[state].start()
+lights.start()
+
+
 while True:
     if(button.value() == False):
         utime.sleep_ms(10)
         if(button.value() == False):
-            LED_RED.value(False)
-            LED_BLUE.value(False)
+            patterns[state].stop()
             state += 1
-
-            
-    if(state == 1):
-        
-        LED_RED.value(1)
-        LED_BLUE.value(0)
-        utime.sleep_ms(200)
-        LED_RED.value(0)
-        LED_BLUE.value(1)
-        utime.sleep_ms(200)
-    
-    elif(state == 2):
-        LED_RED.toggle()
-        LED_BLUE.toggle()
-        utime.sleep_ms(200)
-        
-    elif(state == 3):
-        
-        for i in range(0, 3, 1):
-            LED_RED.value(1)
-            LED_BLUE.value(0)
-            utime.sleep_ms(40)
-            LED_RED.value(0)
-            utime.sleep_ms(40)
-            
-        for i in range(0, 3, 1):
-            LED_RED.value(0)
-            LED_BLUE.value(1)
-            utime.sleep_ms(40)
-            LED_BLUE.value(0)
-            utime.sleep_ms(40)
             
+            if(state >= len(patterns)):
+                state = 0
+                
+            patterns[state].start()
             
-    elif(state == 4):
-        
-         i = 6
-         while(i > 0):
-           LED_RED.on()
-           LED_BLUE.on()
-           utime.sleep_ms(60)
-           LED_RED.off()
-           LED_BLUE.off()
-           utime.sleep_ms(60)
-           i -= 1
-           utime.sleep(0.25)
-           
-    else:
-       LED_RED.value(0)
-       LED_BLUE.value(0)
-       utime.sleep_us(1000000)
-       state = 0
-    
+            while(button.value() == False):
+                utime.sleep_ms(10)
+                
+    utime.sleep_ms(10)
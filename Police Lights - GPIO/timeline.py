@@ -0,0 +1,183 @@
+from micropython import const
+from machine import Timer
+from utime import ticks_ms, ticks_us, ticks_diff, ticks_add
+from array import array
+import math
+
+
+STEP = const(0)
+LINEAR = const(1)
+EASE_IN = const(2)
+EASE_OUT = const(3)
+EASE_IN_OUT = const(4)
+
+
+def easing_table(curve):
+    lut = bytearray(256)
+    
+    for i in range(0, 256):
+        x = (i / 255)
+        
+        if(curve == EASE_IN):
+            y = (x * x)
+        elif(curve == EASE_OUT):
+            y = (1 - ((1 - x) * (1 - x)))
+        elif(curve == EASE_IN_OUT):
+            y = ((1 - math.cos(math.pi * x)) / 2)
+        else:
+            y = x
+            
+        lut[i] = int((y * 255) + 0.5)
+        
+    return lut
+
+
+easing_luts = [easing_table(i) for i in range(STEP, (EASE_IN_OUT + 1))]
+
+
+class timeline():
+    def __init__(self, loop = True):
+        self.loop = loop
+        self.setters = []
+        self.keyframes = []
+        self.running = False
+        self.duration = 1
+        
+        
+    def channel(self, setter):
+        self.setters.append(setter)
+        return (len(self.setters) - 1)
+    
+    
+    def add(self, time_ms, channel, value, easing = STEP):
+        self.keyframes.append((channel, time_ms, value, easing))
+        
+        
+    def compile(self, duration = None):
+        self.keyframes.sort(key = lambda k: (k[0], k[1]))
+        channels = len(self.setters)
+        
+        self.times = array("I", [k[1] for k in self.keyframes])
+        self.values = array("i", [k[2] for k in self.keyframes])
+        self.easing = bytearray([k[3] for k in self.keyframes])
+        self.first = array("H", [0 for _ in range(channels)])
+        self.end = array("H", [0 for _ in range(channels)])
+        
+        for i in range((len(self.keyframes) - 1), -1, -1):
+            self.first[self.keyframes[i][0]] = i
+            
+        for i in range(0, len(self.keyframes)):
+            self.end[self.keyframes[i][0]] = (i + 1)
+            
+        self.cursor = array("H", self.first)
+        self.output = array("i", [0 for _ in range(channels)])
+        self.valid = bytearray(channels)
+        
+        if(duration is None):
+            if(len(self.times) > 0):
+                duration = max(self.times)
+            else:
+                duration = 1
+            
+        self.duration = max(1, duration)
+        
+        
+    def start(self):
+        for i in range(0, len(self.setters)):
+            self.cursor[i] = self.first[i]
+            self.valid[i] = 0
+            
+        self.started = ticks_ms()
+        self.running = True
+        self.update(self.started)
+        
+        
+    def stop(self):
+        self.running = False
+        
+        
+    def update(self, now):
+        t = ticks_diff(now, self.started)
+        
+        if(t >= self.duration):
+            if(self.loop):
+                cycles = (t // self.duration)
+                self.started = ticks_add(self.started, (cycles * self.duration))
+                t -= (cycles * self.duration)
+                
+                for i in range(0, len(self.setters)):
+                    self.cursor[i] = self.first[i]
+            else:
+                t = self.duration
+                self.running = False
+                
+        for ch in range(0, len(self.setters)):
+            first = self.first[ch]
+            end = self.end[ch]
+            
+            if(first == end):
+                continue
+            
+            k = self.cursor[ch]
+            
+            while((k < end) and (self.times[k] <= t)):
+                k += 1
+                
+            self.cursor[ch] = k
+            
+            if(k == first):
+                value = self.values[first]
+            elif(k == end):
+                value = self.values[(end - 1)]
+            else:
+                value = self.values[(k - 1)]
+                e = self.easing[k]
+                
+                if(e != STEP):
+                    t0 = self.times[(k - 1)]
+                    x = easing_luts[e][(((t - t0) * 255) // (self.times[k] - t0))]
+                    value += (((self.values[k] - value) * x) // 255)
+                    
+            if((self.valid[ch] == 0) or (self.output[ch] != value)):
+                self.setters[ch](value)
+                self.output[ch] = value
+                self.valid[ch] = 1
+                
+                
+class player():
+    def __init__(self, period_ms = 10, timer_id = -1):
+        self.period = period_ms
+        self.timelines = []
+        self.load_us = 0
+        self.load = 0
+        self.timer = Timer(timer_id)
+        
+        
+    def add(self, tl):
+        if(tl not in self.timelines):
+            self.timelines.append(tl)
+            
+            
+    def play(self, tl):
+        self.add(tl)
+        tl.start()
+        
+        
+    def start(self):
+        self.timer.init(period = self.period, mode = Timer.PERIODIC, callback = self.tick)
+        
+        
+    def stop(self):
+        self.timer.deinit()
+        
+        
+    def tick(self, timer):
+        begin = ticks_us()
+        now = ticks_ms()
+        
+        for tl in self.timelines:
+            if(tl.running):
+                tl.update(now)
+                
+        self.load_us = ticks_diff(ticks_us(), begin)
+        self.load = ((self.load_us * 100) // (self.period * 1000))
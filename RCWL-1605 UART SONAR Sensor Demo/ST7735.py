@@ -1,7 +1,9 @@
 from micropython import const
-from machine import Pin, SPI
-from utime import sleep_ms
+from machine import Pin, SPI, mem32
+from utime import sleep_ms, sleep_us
 import framebuf
+import rp2
+import sys
 
 
 ST7735_DC_pin = const(8)
@@ -77,6 +79,26 @@ ST7735_MADCTL_MH = const(0x04)
 ST7735_TFT_WIDTH = const(160)
 ST7735_TFT_HEIGHT = const(80)
 
+ST7735_INIT_SEQ = (
+    (ST7735_SLPOUT, b"", 120),
+    (ST7735_INVON, b"", 0),
+    (ST7735_FRMCTR1, b"\x05\x3A\x3A", 0),
+    (ST7735_FRMCTR2, b"\x05\x3A\x3A", 0),
+    (ST7735_FRMCTR3, b"\x05\x3A\x3A\x05\x3A\x3A", 0),
+    (ST7735_INVCTR, b"\x03", 0),
+    (ST7735_PWCTR1, b"\x62\x02\x04", 0),
+    (ST7735_PWCTR2, b"\xC0", 0),
+    (ST7735_PWCTR3, b"\x0D\x00", 0),
+    (ST7735_PWCTR4, b"\x8D\x6A", 0),
+    (ST7735_PWCTR5, b"\x8D\xEE", 0),
+    (ST7735_VMCTR1, b"\x0E", 0),
+    (ST7735_GMCTRP1, b"\x10\x0E\x02\x03\x0E\x07\x02\x07\x0A\x12\x27\x37\x00\x0D\x0E\x10", 0),
+    (ST7735_GMCTRN1, b"\x10\x0E\x03\x03\x0F\x06\x02\x08\x0A\x13\x26\x36\x00\x0D\x0E\x10", 0),
+    (ST7735_COLMOD, b"\x05", 0),
+    (ST7735_MADCTL, bytes([ST7735_MADCTL_MV | ST7735_MADCTL_MY | ST7735_MADCTL_RGB]), 0),
+    (ST7735_DISPON, b"", 0),
+)
+
 CMD = False
 DAT = True
 
@@ -84,6 +106,18 @@ LOW = False
 HIGH = True
 
 
+SPI_SSPDR = const(0x008)
+SPI_SSPSR = const(0x00C)
+SPI_SSPSR_BSY = const(0x10)
+
+if('RP2350' in sys.implementation._machine):
+    SPI_BASE = (0x40080000, 0x40088000)
+    SPI_TX_DREQ = (24, 26)
+else:
+    SPI_BASE = (0x4003C000, 0x40040000)
+    SPI_TX_DREQ = (16, 18)
+
+
 class TFT096(framebuf.FrameBuffer):
     
     def __init__(self):
@@ -114,8 +148,16 @@ class TFT096(framebuf.FrameBuffer):
         self.ST7735_SPI = SPI(1, 10000_000, polarity = False, phase = False, sck = self.ST7735_SCK, mosi = self.ST7735_MOSI, miso = None)
         
         self.ST7735_DC = Pin(ST7735_DC_pin, Pin.OUT)
+        self.command_buffer = bytearray(1)
+        self.window_buffer = bytearray(4)
+        self.dma = rp2.DMA()
+        self.dma_ctrl = self.dma.pack_ctrl(size = 0, inc_write = False, treq_sel = SPI_TX_DREQ[1], irq_quiet = False)
+        self.dma.irq(handler = self.dma_done, hard = False)
+        self.dma_active = False
+        self.dma_callback = None
         
         self.buffer = bytearray(self.height * self.width * 2)
+        self.layer = None
         super().__init__(self.buffer, self.width, self.height, framebuf.RGB565)
         
         self.TFT_init()
@@ -124,138 +166,66 @@ class TFT096(framebuf.FrameBuffer):
         
     def disp_reset(self):
         self.ST7735_RST.value(HIGH)
-        sleep_ms(200)
         self.ST7735_RST.value(LOW)
-        sleep_ms(200)
+        sleep_us(10)
         self.ST7735_RST.value(HIGH)
-        sleep_ms(200)
-        
+        sleep_ms(120)
+
 
     def send(self, value, mode):
         self.ST7735_CS.value(LOW)
         self.ST7735_DC.value(mode)
-        self.ST7735_SPI.write(bytearray([value]))
+        self.command_buffer[0] = value
+        self.ST7735_SPI.write(self.command_buffer)
         self.ST7735_CS.value(HIGH)
         
         
-    def TFT_init(self):
-        self.disp_reset()
-        self.ST7735_BL.value(HIGH)
-        self.send(ST7735_SLPOUT, CMD)
-        sleep_ms(120)
-        
-        self.send(ST7735_INVON, CMD)
-        self.send(ST7735_INVON, CMD)
+    def cmd(self, command, data = b""):
+        self.ST7735_CS.value(LOW)
+        self.ST7735_DC.value(CMD)
+        self.command_buffer[0] = command
+        self.ST7735_SPI.write(self.command_buffer)
 
-        self.send(ST7735_FRMCTR1, CMD)
-        self.send(0x05, DAT)
-        self.send(0x3A, DAT)
-        self.send(0x3A, DAT)
-        
-        self.send(ST7735_FRMCTR2, CMD)
-        self.send(0x05, DAT)
-        self.send(0x3A, DAT)
-        self.send(0x3A, DAT)
-        
-        self.send(ST7735_FRMCTR3, CMD)
-        self.send(0x05, DAT)
-        self.send(0x3A, DAT)
-        self.send(0x3A, DAT)
-        self.send(0x05, DAT)
-        self.send(0x3A, DAT)
-        self.send(0x3A, DAT)
-
-        self.send(ST7735_INVCTR, CMD)
-        self.send(0x03, DAT)
-
-        self.send(ST7735_PWCTR1, CMD)
-        self.send(0x62, DAT) 
-        self.send(0x02, DAT) 
-        self.send(0x04, DAT)
-        
-        self.send(ST7735_PWCTR2, CMD)
-        self.send(0xC0, DAT)
+        if(len(data) > 0):
+            self.ST7735_DC.value(DAT)
+            self.ST7735_SPI.write(data)
 
-        self.send(ST7735_PWCTR3, CMD)
-        self.send(0x0D, DAT)
-        self.send(0x00, DAT)
+        self.ST7735_CS.value(HIGH)
 
-        self.send(ST7735_PWCTR4, CMD)
-        self.send(0x8D, DAT)
-        self.send(0x6A, DAT)
 
-        self.send(ST7735_PWCTR5, CMD)
-        self.send(0x8D, DAT)
-        self.send(0xEE, DAT)
+    def send_sequence(self, sequence):
+        for command, parameters, delay in sequence:
+            self.cmd(command, parameters)
+
+            if(delay > 0):
+                sleep_ms(delay)
+
+
+    def TFT_init(self):
+        self.disp_reset()
+        self.ST7735_BL.value(HIGH)
+        self.send_sequence(ST7735_INIT_SEQ)
 
-        self.send(ST7735_VMCTR1, CMD)
-        self.send(0x0E, DAT)
-        
-        self.send(ST7735_GMCTRP1, CMD)
-        self.send(0x10, DAT)
-        self.send(0x0E, DAT)
-        self.send(0x02, DAT)
-        self.send(0x03, DAT)
-        self.send(0x0E, DAT)
-        self.send(0x07, DAT)
-        self.send(0x02, DAT)
-        self.send(0x07, DAT)
-        self.send(0x0A, DAT)
-        self.send(0x12, DAT)
-        self.send(0x27, DAT)
-        self.send(0x37, DAT)
-        self.send(0x00, DAT)
-        self.send(0x0D, DAT)
-        self.send(0x0E, DAT)
-        self.send(0x10, DAT)
-        
-        self.send(ST7735_GMCTRN1, CMD)
-        self.send(0x10, DAT)
-        self.send(0x0E, DAT)
-        self.send(0x03, DAT)
-        self.send(0x03, DAT)
-        self.send(0x0F, DAT)
-        self.send(0x06, DAT)
-        self.send(0x02, DAT)
-        self.send(0x08, DAT)
-        self.send(0x0A, DAT)
-        self.send(0x13, DAT)
-        self.send(0x26, DAT)
-        self.send(0x36, DAT)
-        self.send(0x00, DAT)
-        self.send(0x0D, DAT)
-        self.send(0x0E, DAT)
-        self.send(0x10, DAT)
-                 
-        self.send(ST7735_COLMOD, CMD)
-        self.send(0x05, DAT)
-        
-        self.send(ST7735_MADCTL, CMD)
-        self.send((ST7735_MADCTL_MV | ST7735_MADCTL_MY | ST7735_MADCTL_RGB), DAT)
 
-        self.send(ST7735_DISPON, CMD)
-        sleep_ms(10)
-        
-        
     def set_windows(self, xs, ys, xe, ye):
         xs = xs + 1
         xe = xe + 1
         ys = ys + 26
         ye = ye + 26
         
-        self.send(ST7735_CASET, CMD)
-        self.send(0x00, DAT)
-        self.send(xs, DAT)
-        self.send(0x00, DAT)
-        self.send(xe, DAT)
-
-        self.send(ST7735_RASET, CMD)
-        self.send(0x00, DAT)
-        self.send(ys, DAT)
-        self.send(0x00, DAT)
-        self.send(ye, DAT)
-
-        self.send(ST7735_RAMWR, CMD)
+        self.window_buffer[0] = 0x00
+        self.window_buffer[1] = xs
+        self.window_buffer[2] = 0x00
+        self.window_buffer[3] = xe
+        self.cmd(ST7735_CASET, self.window_buffer)
+
+        self.window_buffer[0] = 0x00
+        self.window_buffer[1] = ys
+        self.window_buffer[2] = 0x00
+        self.window_buffer[3] = ye
+        self.cmd(ST7735_RASET, self.window_buffer)
+
+        self.cmd(ST7735_RAMWR)
         
 
     def set_RAM_address(self):
@@ -263,8 +233,55 @@ class TFT096(framebuf.FrameBuffer):
         
         
     def display(self):    
+        self.wait()
         self.set_RAM_address()    
         self.ST7735_DC.value(DAT)
         self.ST7735_CS.value(LOW)
         self.ST7735_SPI.write(self.buffer)
         self.ST7735_CS.value(HIGH)
+
+
+    def busy(self):
+        return self.dma_active
+
+
+    def wait(self):
+        while(self.dma_active):
+            pass
+
+
+    def dma_done(self, dma):
+        while(mem32[SPI_BASE[1] + SPI_SSPSR] & SPI_SSPSR_BSY):
+            pass
+
+        self.ST7735_CS.value(HIGH)
+        self.dma_active = False
+
+        if(self.dma_callback != None):
+            self.dma_callback()
+
+
+    def start_dma(self, data, callback):
+        self.dma_callback = callback
+        self.dma_active = True
+
+        self.ST7735_DC.value(DAT)
+        self.ST7735_CS.value(LOW)
+        self.dma.config(read = data, write = (SPI_BASE[1] + SPI_SSPDR), count = len(data), ctrl = self.dma_ctrl, trigger = True)
+
+
+    def show_async(self, callback = None):
+        self.wait()
+        self.set_RAM_address()
+        self.start_dma(self.buffer, callback)
+
+
+    def save_layer(self):
+        if(self.layer == None):
+            self.layer = bytearray(len(self.buffer))
+
+        self.layer[:] = self.buffer
+
+
+    def restore_layer(self):
+        self.buffer[:] = self.layer
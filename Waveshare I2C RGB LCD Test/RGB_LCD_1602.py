@@ -21,6 +21,7 @@ REG_BLUE = const(0x02)
 REG_MODE_1 = const(0x00)
 REG_MODE_2 = const(0x01)
 REG_OUTPUT = const(0x08)
+REG_AUTO_INCREMENT_PWM = const(0xA0)
 
 LCD_CLEAR_DISPLAY = const(0x01)
 LCD_RETURN_HOME = const(0x02)
@@ -62,51 +63,117 @@ LCD_5x8_DOTS = const(0x00)
 DAT = const(0x40)
 CMD = const(0x80)
 
+#DDRAM shadow and burst sizes
+LCD_DDRAM_COLUMNS = const(40)
+LCD_RUN_GAP = const(2)
+
 
 class RGB1602:
   def __init__(self, row, col):
     self._row = row
     self._col = col
     self._showfunction = (LCD_4_BIT_MODE | LCD_1_LINE | LCD_5x8_DOTS)
+    self.byte = bytearray(1)
+    self.rgb = bytearray(3)
+    self.rgb_valid = False
+    self.registers = {}
+    self.shadow = bytearray(b" " * (LCD_DDRAM_COLUMNS * 2))
+    self.packet = bytearray(LCD_DDRAM_COLUMNS + 3)
+    self.packet_view = memoryview(self.packet)
+    self.x_pos = 0
+    self.y_pos = 0
     self.initialize(self._row, self._col)
 
 
   def write(self, value, loc):
-    RGB_LCD_I2C.writeto_mem(LCD_I2C_address, loc, chr(value))
+    self.byte[0] = value
+    RGB_LCD_I2C.writeto_mem(LCD_I2C_address, loc, self.byte)
     
     
   def set_reg(self, reg, value):
-    RGB_LCD_I2C.writeto_mem(RGB_I2C_address, reg, chr(value))
+    if(self.registers.get(reg) == value):
+        return
+    
+    self.byte[0] = value
+    RGB_LCD_I2C.writeto_mem(RGB_I2C_address, reg, self.byte)
+    self.registers[reg] = value
 
 
   def set_RGB(self, r, g, b):
-    self.set_reg(REG_RED, r)
-    self.set_reg(REG_GREEN, g)
-    self.set_reg(REG_BLUE, b)
+    if(self.rgb_valid and (self.rgb[0] == b) and (self.rgb[1] == g) and (self.rgb[2] == r)):
+        return
+    
+    self.rgb[0] = b
+    self.rgb[1] = g
+    self.rgb[2] = r
+    RGB_LCD_I2C.writeto_mem(RGB_I2C_address, (REG_AUTO_INCREMENT_PWM | REG_BLUE), self.rgb)
+    self.rgb_valid = True
 
 
   def goto_xy(self, x_pos, y_pos):
+      self.x_pos = x_pos
+      
       if(y_pos == 0):
-          x_pos |= 0x80
+          self.y_pos = 0
       else:
-          x_pos |= 0xC0
-      
-      RGB_LCD_I2C.writeto(LCD_I2C_address, bytearray([0x80, x_pos]))
+          self.y_pos = 1
 
 
   def clear_home(self):
       self.write(LCD_CLEAR_DISPLAY, CMD)
       self.write(LCD_RETURN_HOME, CMD)
       sleep_ms(2) 
+      
+      for i in range(0, len(self.shadow)):
+          self.shadow[i] = 0x20
+          
+      self.x_pos = 0
+      self.y_pos = 0
     
     
   def put_chr(self, ch):
-      self.write(ord(ch), DAT)
+      self.put_str(ch)
         
         
   def put_str(self, ch_str):
+      length = 0
+      gap = 0
+      
       for chr in ch_str:
-            self.put_chr(chr)
+          if(self.x_pos >= LCD_DDRAM_COLUMNS):
+              break
+          
+          value = ord(chr)
+          i = ((self.y_pos * LCD_DDRAM_COLUMNS) + self.x_pos)
+          
+          if(self.shadow[i] == value):
+              gap += 1
+              
+          else:
+              if((length > 0) and (gap > LCD_RUN_GAP)):
+                  RGB_LCD_I2C.writeto(LCD_I2C_address, self.packet_view[0:length])
+                  length = 0
+                  
+              if(length == 0):
+                  self.packet[0] = CMD
+                  self.packet[1] = (LCD_SET_DDRAM_ADDR | (self.y_pos << 6) | self.x_pos)
+                  self.packet[2] = DAT
+                  length = 3
+                  
+              else:
+                  for j in range((i - gap), i):
+                      self.packet[length] = self.shadow[j]
+                      length += 1
+                      
+              self.packet[length] = value
+              length += 1
+              self.shadow[i] = value
+              gap = 0
+              
+          self.x_pos += 1
+          
+      if(length > 0):
+          RGB_LCD_I2C.writeto(LCD_I2C_address, self.packet_view[0:length])
 
 
   def display(self):